@@ -2,6 +2,7 @@
 Flask 应用工厂
 """
 from flask import Flask
+from flask_compress import Compress
 from api.config import Config
 from api.routes import register_routes
 from api.middleware import register_error_handlers, setup_cors
@@ -24,7 +25,16 @@ def create_app(config_class=Config):
     
     # 加载配置
     app.config.from_object(config_class)
-    
+
+    # 大几何响应用 orjson 编码（C 实现，原生支持 numpy），
+    # 环境里没有 orjson 时保持 Flask 默认提供器
+    from api.utils.json_provider import HAS_ORJSON, OrjsonProvider
+    if HAS_ORJSON:
+        app.json = OrjsonProvider(app)
+
+    # 压缩大响应（几何 JSON / 二进制网格），算法和阈值见 Config
+    Compress(app)
+
     # 设置 CORS
     setup_cors(app)
     
@@ -1,11 +1,15 @@
 """
-应用入口
+应用入口（仅开发环境）
+
+生产环境请使用仓库根目录的 wsgi.py 配合 gunicorn 运行
 """
 import os
 import sys
 
-# 添加父目录到路径
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 添加父目录到路径（幂等：避免重复 append 拉长 import 查找链）
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 
 from api import create_app
 
@@ -23,4 +27,8 @@ if __name__ == '__main__':
     print("   - GET  /api/model/info   - 获取模型信息")
     print("=" * 50)
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # 调试器按需开启（FLASK_DEBUG=1）；关掉自动重载：
+    # reloader 的 stat 线程会在每次请求间轮询所有已导入模块
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    app.run(debug=debug, host='0.0.0.0', port=5000,
+            use_reloader=False, threaded=True)
@@ -9,16 +9,47 @@ class Config:
     """基础配置"""
     # 文件上传配置
     MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB
-    UPLOAD_FOLDER = tempfile.gettempdir()
+    # 优先用 tmpfs（/dev/shm）存上传临时文件：STEP 字节只在内存里
+    # 中转（写入后马上被 StepLoader 读回），不必下盘再回读
+    UPLOAD_FOLDER = ('/dev/shm' if os.path.isdir('/dev/shm')
+                     else tempfile.gettempdir())
     ALLOWED_EXTENSIONS = {'step', 'stp'}
+    # 小于该阈值的上传直接在内存中加载，跳过临时文件往返
+    IN_MEMORY_UPLOAD_LIMIT = 16 * 1024 * 1024  # 16MB
     
     # 网格转换配置
     LINEAR_DEFLECTION = 0.5
     ANGULAR_DEFLECTION = 0.5
     
+    # 响应压缩配置（Flask-Compress）
+    # CAD 坐标数据重复模式多，br/gzip 压缩比约 2 倍以上
+    # 文本导出（CSV/txt 报告）同样是高重复数值文本，一并压缩
+    COMPRESS_MIMETYPES = ['application/json', 'application/octet-stream',
+                          'text/csv', 'text/plain']
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_LEVEL = 4
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_MIN_SIZE = 512
+    # 不压缩流式响应：默认的 COMPRESS_STREAMS=True 会让压缩层先
+    # get_data() 把整个生成器吃进内存再压缩，上传 JSON 流和 txt
+    # 报告流的分块发送（受限峰值内存、提前首字节）全被抵消。
+    # 关掉后流式响应原样透传，整体响应仍正常压缩
+    COMPRESS_STREAMS = False
+
+    # 允许的跨域来源（逗号分隔），不设置时开放给所有来源（开发用）
+    FRONTEND_ORIGINS = (
+        os.environ.get('FRONTEND_ORIGINS', '').split(',')
+        if os.environ.get('FRONTEND_ORIGINS') else '*'
+    )
+
     # 会话配置
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
-    SESSION_TYPE = 'filesystem'
+
+    # 前置 nginx 时启用 X-Sendfile：send_from_directory 只回一个
+    # X-Accel-Redirect 头，静态文件由 nginx 用 sendfile(2) 从页缓存
+    # 直接送进 socket，完全绕开 Python/WSGI 的读写拷贝。
+    # 需要 nginx 配置 internal location，见 docs/nginx.md
+    USE_X_SENDFILE = bool(os.environ.get('BEHIND_NGINX'))
 
 
 class DevelopmentConfig(Config):
@@ -31,4 +62,7 @@ class ProductionConfig(Config):
     DEBUG = False
     # 生产环境应该从环境变量读取敏感配置
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 生产环境限制为 50MB
+    # 静态资源缓存 1 小时：生产环境静态文件应由 nginx 直接提供
+    # （见 docs/nginx.md），这里兜底 Flask 自己发送时的缓存头
+    SEND_FILE_MAX_AGE_DEFAULT = 3600
 
@@ -13,9 +13,14 @@ def setup_cors(app):
     """
     CORS(app, resources={
         r"/api/*": {
-            "origins": "*",  # 生产环境应该限制具体域名
+            # 来源列表从 FRONTEND_ORIGINS 环境变量读取（生产环境必配）
+            "origins": app.config.get('FRONTEND_ORIGINS', '*'),
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"]
+            "allow_headers": ["Content-Type", "Authorization",
+                              "X-Filename", "X-Upload-Id", "Content-Range"],
+            # 预检结果缓存一天：浏览器不再为每个跨域 POST 先发一次
+            # OPTIONS 往返
+            "max_age": 86400
         }
     })
 
@@ -3,6 +3,14 @@
 """
 from flask import send_from_directory
 
+from .health import bp as health_bp
+from .upload import bp as upload_bp
+from .model import bp as model_bp
+from .export import bp as export_bp
+
+# 蓝图在模块导入时解析一次；register_routes 只做注册循环
+BLUEPRINTS = (health_bp, upload_bp, model_bp, export_bp)
+
 
 def register_routes(app):
     """
@@ -13,17 +21,17 @@ def register_routes(app):
     """
     
     # 主页路由
+    # 生产环境由 nginx 直接提供 index.html 和 /static（docs/nginx.md），
+    # 请求不经过 Python；此路由是开发环境和无反代部署的回退
     @app.route('/')
     def index():
         """返回前端页面"""
-        return send_from_directory('../web', 'index.html')
+        # conditional 响应：浏览器重访时命中 ETag/mtime 校验，
+        # 服务器只回 304 头；max_age 内则完全不发请求
+        return send_from_directory('../web', 'index.html',
+                                   max_age=300, conditional=True)
     
     # 注册蓝图
-    from .health import bp as health_bp
-    from .upload import bp as upload_bp
-    from .model import bp as model_bp
-    
-    app.register_blueprint(health_bp)
-    app.register_blueprint(upload_bp)
-    app.register_blueprint(model_bp)
+    for bp in BLUEPRINTS:
+        app.register_blueprint(bp)
 
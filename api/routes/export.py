@@ -0,0 +1,227 @@
+"""
+结果导出路由
+"""
+import csv
+import io
+from collections import OrderedDict
+
+from flask import Blueprint, Response, request, stream_with_context
+from api.services import SessionService
+from api.utils import error_response
+
+bp = Blueprint('export', __name__, url_prefix='/api')
+
+# CSV 文本缓存：{文件内容哈希: CSV 文本}
+# 焊缝列表由形状唯一决定，同一个模型反复点导出时直接复用序列化结果
+_CSV_CACHE_SIZE = 8
+_csv_cache = OrderedDict()
+
+# CSV 列顺序（与焊缝记录字段对应）
+_CSV_COLUMNS = ['Edge_ID', 'Type', 'Confidence', 'Angle', 'Length',
+                'Face1_ID', 'Face2_ID', 'Face1_Type', 'Face2_Type']
+
+# 支持的导出格式（模块级常量，逐请求校验只是一次集合成员测试）
+_EXPORT_FORMATS = frozenset({'csv', 'txt'})
+
+# 预编译的三元组坐标格式化器：一次 C 级 format 调用格式化整个坐标，
+# 替代逐分量 f-string + join（每个分量都要重入解释器）
+_fmt3 = '{:.6f}, {:.6f}, {:.6f}'.format
+_fmt_ctrl_pt = '    控制点[{}]: ({:.3f}, {:.3f}, {:.3f})\n'.format
+
+
+def _preview_indices(n, k=3):
+    """
+    取前 k 个和后 k 个元素的下标（去重且升序）
+
+    n < 2k 时首尾区间重叠，直接 set 去重，
+    不会像 [0,1,2,-3,-2,-1] 固定下标那样重复输出中间元素。
+
+    Args:
+        n: 序列长度
+        k: 首尾各取几个
+
+    Returns:
+        list: 下标列表
+    """
+    return sorted(set(range(min(k, n))) | set(range(max(0, n - k), n)))
+
+
+def _get_seams(model):
+    """
+    取出当前模型的潜在焊缝列表
+
+    Args:
+        model: 会话模型字典（SessionService.get_model 的返回值）
+
+    Returns:
+        list or None: 焊缝记录列表；没有模型时返回 None。
+        模型存在但没有焊缝时返回空列表（序列化器对无焊缝的模型
+        会整个省略 features 键，不能把键缺失当成没有模型）
+    """
+    if model['shape'] is None:
+        return None
+
+    geometry_data = model['geometry_data'] or {}
+    features = geometry_data.get('features', {})
+    return features.get('potential_weld_seams', [])
+
+
+def _seams_to_csv(seams):
+    """
+    把焊缝记录序列化为 CSV 文本
+
+    优先走 pandas 的 C 级 to_csv：按列一次性构建 DataFrame，
+    避免逐行 writer.writerow 的解释器开销；
+    环境里没有 pandas 时退回标准库 csv 模块。
+
+    Args:
+        seams: 焊缝记录列表
+
+    Returns:
+        str: CSV 文本
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None:
+        props = [s['properties'] for s in seams]
+        df = pd.DataFrame({
+            'Edge_ID': [s['edge_id'] for s in seams],
+            'Type': [s['type'] for s in seams],
+            'Confidence': [s['confidence'] for s in seams],
+            'Angle': [p['angle'] for p in props],
+            'Length': [p['length'] for p in props],
+            'Face1_ID': [p['face1_id'] for p in props],
+            'Face2_ID': [p['face2_id'] for p in props],
+            'Face1_Type': [p['face1_type'] for p in props],
+            'Face2_Type': [p['face2_type'] for p in props],
+        })
+        return df.to_csv(index=False)
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(_CSV_COLUMNS)
+    for s in seams:
+        p = s['properties']
+        writer.writerow([
+            s['edge_id'], s['type'], s['confidence'],
+            p['angle'], p['length'],
+            p['face1_id'], p['face2_id'],
+            p['face1_type'], p['face2_type'],
+        ])
+    return output.getvalue()
+
+
+def _seams_txt_stream(seams, filename, edges_by_id):
+    """
+    逐条生成焊缝文本报告的分块
+
+    每条焊缝 yield 一个文本块：Flask 通过 WSGI 分块发送，
+    不在内存里拼整份报告（峰值内存从 2x 报告体积降到单条记录），
+    客户端也能在全部记录生成完之前开始下载。
+
+    Args:
+        seams: 焊缝记录列表
+        filename: 源模型文件名
+        edges_by_id: {边 id: 边记录}，用于补充起止点坐标
+
+    Yields:
+        str: 文本块
+    """
+    yield (
+        f"潜在焊缝分析报告\n"
+        f"{'=' * 50}\n"
+        f"源文件: {filename or 'unknown'}\n"
+        f"焊缝总数: {len(seams)}\n"
+        f"{'=' * 50}\n"
+    )
+
+    for i, seam in enumerate(seams, 1):
+        # 每条焊缝攒一批行后 ''.join 一次性 yield：
+        # 避免向 WSGI 层抛出成千上万的微小字符串
+        p = seam['properties']
+        parts = []
+        w = parts.append
+        w(f"\n[{i}] 边 #{seam['edge_id']}\n")
+        w(f"    类型: {seam['type']}\n")
+        w(f"    置信度: {seam['confidence']:.2f}\n")
+        w(f"    角度: {p['angle']:.3f}°\n")
+        w(f"    长度: {p['length']:.6f}\n")
+        w(f"    相邻面: #{p['face1_id']} ({p['face1_type']}) / "
+          f"#{p['face2_id']} ({p['face2_type']})\n")
+
+        edge_data = edges_by_id.get(seam['edge_id'])
+        curve_data = edge_data.get('curve_data') if edge_data else None
+        if curve_data and 'start' in curve_data and 'end' in curve_data:
+            w(f"    起点: ({_fmt3(*curve_data['start'])})\n")
+            w(f"    终点: ({_fmt3(*curve_data['end'])})\n")
+
+        # 样条/Bezier 边：列出首尾各 3 个控制点（短列表自动去重）
+        control_points = (curve_data or {}).get('control_points')
+        if control_points:
+            for idx in _preview_indices(len(control_points)):
+                w(_fmt_ctrl_pt(idx, *control_points[idx]))
+
+        yield ''.join(parts)
+
+
+@bp.route('/export', methods=['GET'])
+def export_results():
+    """
+    导出潜在焊缝列表
+
+    Query:
+        format: 导出格式，csv（默认）或 txt
+
+    Returns:
+        text/csv 或 text/plain: 焊缝记录（附件下载）
+    """
+    try:
+        export_format = request.args.get('format', 'csv')
+        if export_format not in _EXPORT_FORMATS:
+            return error_response(
+                f'不支持的导出格式: {export_format}（支持 csv / txt）', 400)
+
+        # 会话模型字典取一次，文件名/几何数据/哈希都从它读取
+        model = SessionService.get_model()
+        seams = _get_seams(model)
+        if seams is None:
+            return error_response('当前没有加载的模型', 404)
+        if not seams:
+            return error_response('当前模型没有识别出潜在焊缝', 404)
+
+        if export_format == 'txt':
+            edges = (model['geometry_data'] or {}) \
+                .get('model', {}).get('edges', [])
+            edges_by_id = {e['id']: e for e in edges}
+            return Response(
+                stream_with_context(
+                    _seams_txt_stream(seams, model['filename'], edges_by_id)),
+                mimetype='text/plain',
+                headers={'Content-Disposition':
+                         'attachment; filename=weld_seams.txt'}
+            )
+
+        # 重复导出同一个模型时命中缓存，跳过整个序列化
+        file_hash = model['file_hash']
+        csv_text = _csv_cache.get(file_hash) if file_hash else None
+        if csv_text is not None:
+            _csv_cache.move_to_end(file_hash)
+        else:
+            csv_text = _seams_to_csv(seams)
+            if file_hash:
+                _csv_cache[file_hash] = csv_text
+                if len(_csv_cache) > _CSV_CACHE_SIZE:
+                    _csv_cache.popitem(last=False)
+
+        return Response(
+            csv_text,
+            mimetype='text/csv',
+            headers={'Content-Disposition':
+                     'attachment; filename=weld_seams.csv'}
+        )
+
+    except Exception as e:
+        return error_response(f'导出失败: {str(e)}', 500)
@@ -1,22 +1,39 @@
 """
 健康检查路由
 """
-from flask import Blueprint
-from api.utils import success_response
+import hashlib
+import json
+
+from flask import Blueprint, Response, request
 
 bp = Blueprint('health', __name__, url_prefix='/api')
 
+# 健康检查响应内容不变：模块加载时序列化一次，
+# 每个请求直接返回预构建的 bytes，省掉 dict 构建和 JSON 编码
+_HEALTH_BODY = json.dumps({
+    'success': True,
+    'message': 'CAD模型查看器运行正常',
+    'data': {'status': 'healthy'}
+}, ensure_ascii=False).encode('utf-8')
+_HEALTH_ETAG = hashlib.md5(_HEALTH_BODY).hexdigest()
+
 
 @bp.route('/health', methods=['GET'])
 def health_check():
     """
     健康检查端点
-    
+
+    响应体是常量，带 ETag；客户端带 If-None-Match 命中时
+    返回无响应体的 304。
+
     Returns:
         JSON: 服务状态信息
     """
-    return success_response(
-        data={'status': 'healthy'},
-        message='CAD模型查看器运行正常'
-    )
+    if _HEALTH_ETAG in request.if_none_match:
+        return Response(status=304, headers={'ETag': _HEALTH_ETAG})
 
+    return Response(
+        _HEALTH_BODY,
+        mimetype='application/json',
+        headers={'ETag': _HEALTH_ETAG}
+    )
@@ -1,12 +1,49 @@
 """
 模型操作路由
 """
-from flask import Blueprint
-from api.services import SessionService
-from api.utils import success_response, error_response
+from flask import Blueprint, Response, request
+from api.services import ModelService, SessionService
+from api.utils import success_response, error_response, mesh_response, wants_msgpack
 
 bp = Blueprint('model', __name__, url_prefix='/api')
 
+# /model/info 响应体缓存：{ETag: 响应字节}
+# 前端以 1~5Hz 轮询该接口，而内容只在上传/清除时变化；
+# 命中时跳过 dict 构建和 JSON 编码（没带 If-None-Match 的客户端也受益）
+_info_cache = {}
+_INFO_CACHE_SIZE = 4
+
+
+def _etag_matches(etag):
+    """
+    If-None-Match 是否命中指定 ETag
+
+    ETag 必须走 response.set_etag 发出带引号的标准形式：
+    Flask-Compress 按 `etag[:-1] + ':' + 算法 + etag[-1]` 改写 ETag，
+    裸值会被改写成错位的字符串，客户端回传后永远匹配不上。
+    这里同时接受压缩层追加了算法后缀的变体
+    （如 `abc:mesh:0` 与 `abc:mesh:0:br`），304 判断对
+    压缩前后的响应都成立。
+
+    Args:
+        etag: 未加引号的 ETag 值，None 时恒为不命中
+
+    Returns:
+        bool: 是否命中
+    """
+    if etag is None:
+        return False
+    prefix = etag + ':'
+    return any(tag == etag or tag.startswith(prefix)
+               for tag in request.if_none_match)
+
+
+def _not_modified(etag):
+    """构建带 ETag 的 304 响应"""
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
 
 @bp.route('/clear', methods=['POST'])
 def clear_session():
@@ -18,12 +55,55 @@ def clear_session():
     """
     try:
         SessionService.clear_model()
+        ModelService.clear_cache()
+        _info_cache.clear()
         return success_response(message='会话已清除')
     
     except Exception as e:
         return error_response(f'清除会话失败: {str(e)}', 500)
 
 
+@bp.route('/mesh', methods=['GET'])
+def get_mesh():
+    """
+    获取当前模型指定 LOD 的预览网格（二进制载荷）
+
+    Query:
+        lod: LOD 等级（0 最粗，默认 0）
+
+    Returns:
+        application/octet-stream: 打包后的网格数据
+    """
+    try:
+        # 会话模型字典取一次，后续字段直接读取：
+        # 免去 has_model/get_file_hash 各自再查一轮
+        model = SessionService.get_model()
+        if model['shape'] is None:
+            return error_response('当前没有加载的模型', 404)
+
+        file_hash = model['file_hash']
+        lod = request.args.get('lod', 0, type=int)
+
+        # 网格由 (内容哈希, LOD) 唯一决定：命中 If-None-Match 时
+        # 直接 304，连缓存里的网格打包都省掉
+        etag = f'{file_hash}:mesh:{lod}' if file_hash else None
+        if _etag_matches(etag):
+            return _not_modified(etag)
+
+        mesh = ModelService.mesh_for(file_hash, lod)
+        if mesh is None:
+            return error_response('网格不可用，请重新上传模型', 404)
+
+        response = mesh_response(mesh)
+        if etag:
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, max-age=60'
+        return response
+
+    except Exception as e:
+        return error_response(f'获取网格失败: {str(e)}', 500)
+
+
 @bp.route('/model/info', methods=['GET'])
 def get_model_info():
     """
@@ -34,16 +114,43 @@ def get_model_info():
     """
     try:
         model = SessionService.get_model()
-        has_model = SessionService.has_model()
-        
-        return success_response(
+        has_model = model['shape'] is not None
+
+        # 模型信息在下一次上传/清除前不变：按内容哈希做 ETag，
+        # 前端轮询时重复 GET 直接 304
+        file_hash = model['file_hash']
+        etag = f'{file_hash}:info' if has_model and file_hash else None
+        if _etag_matches(etag):
+            return _not_modified(etag)
+
+        # 响应体缓存只服务 JSON 客户端：msgpack 协商的响应体
+        # 不入缓存，避免二进制字节被当作 application/json 重放
+        cacheable = etag is not None and not wants_msgpack()
+        if cacheable and etag in _info_cache:
+            response = Response(
+                _info_cache[etag],
+                mimetype='application/json',
+                headers={'Cache-Control': 'private, max-age=60'}
+            )
+            response.set_etag(etag)
+            return response
+
+        response = success_response(
             data={
                 'has_model': has_model,
                 'filename': model['filename'] if has_model else None
             },
             message='获取模型信息成功'
         )
-    
+        if etag:
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, max-age=60'
+            if cacheable:
+                if len(_info_cache) >= _INFO_CACHE_SIZE:
+                    _info_cache.clear()
+                _info_cache[etag] = response.get_data()
+        return response
+
     except Exception as e:
         return error_response(f'获取模型信息失败: {str(e)}', 500)
 
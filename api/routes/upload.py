@@ -1,12 +1,173 @@
 """
 文件上传路由
 """
-from flask import Blueprint, request
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import time
+
+from flask import Blueprint, Response, current_app, request, \
+    stream_with_context
 from api.services import FileService, ModelService, SessionService
-from api.utils import validate_file, success_response, error_response
+from api.utils import (validate_file, allowed_file, success_response,
+                       error_response, mesh_response, wants_msgpack)
+from api.utils.json_provider import HAS_ORJSON
+
+if HAS_ORJSON:
+    import orjson
+
+    # 与 OrjsonProvider._OPTIONS 保持一致：topology 子树
+    # （edge_face_map / face_adjacency / vertex_edge_map）是整数键字典，
+    # 不带 OPT_NON_STR_KEYS 时 orjson.dumps 会在流中途抛 TypeError
+    _ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY
+                       | orjson.OPT_NON_STR_KEYS)
 
 bp = Blueprint('upload', __name__, url_prefix='/api')
 
+# 分块上传状态：{upload_id: {'path', 'filename', 'size', 'chunks', 'mtime'}}
+# chunks 按起始偏移去重，重传同一块不会重复计数；
+# mtime 记录最近一次收到块的时刻（monotonic），用于过期清理
+_chunk_uploads = {}
+_chunk_lock = threading.Lock()
+
+# 中途放弃的上传超过该时长没有新块即视为废弃：状态条目和临时文件
+# 一并清理。UPLOAD_FOLDER 优先落在 /dev/shm，不清理的话每个废弃
+# 上传都把最多 MAX_CONTENT_LENGTH 的内存永久钉住
+_CHUNK_UPLOAD_TTL = 30 * 60  # 秒
+
+# Content-Range: bytes X-Y/Z
+_CONTENT_RANGE_RE = re.compile(r'bytes (\d+)-(\d+)/(\d+)')
+
+
+def _sweep_stale_uploads(now):
+    """
+    剔除超时未活动的分块上传（调用方必须已持有 _chunk_lock）
+
+    Args:
+        now: 当前 time.monotonic() 时刻
+
+    Returns:
+        list: 被剔除条目的临时文件路径（由调用方在锁外删除）
+    """
+    stale = [upload_id for upload_id, state in _chunk_uploads.items()
+             if now - state['mtime'] > _CHUNK_UPLOAD_TTL]
+    paths = []
+    for upload_id in stale:
+        paths.append(_chunk_uploads.pop(upload_id)['path'])
+    return paths
+
+
+def _stream_upload_json(geometry_data, filename):
+    """
+    分块生成上传响应的 JSON 字节
+
+    几何载荷按子树（vertices / edges / faces / topology / features）
+    分别编码并立即发出：不在内存里拼整个响应字符串，
+    峰值内存回到单个子树大小，客户端在编码完成前就能收到首字节。
+
+    Args:
+        geometry_data: 序列化后的几何数据字典
+        filename: 源文件名
+
+    Yields:
+        bytes: JSON 片段
+    """
+    head = orjson.dumps({
+        'success': True,
+        'message': 'STEP文件上传成功',
+        'filename': filename
+    }, option=_ORJSON_OPTIONS)
+    # 去掉结尾的 '}'，拼接 geometry 字段后续写
+    yield head[:-1] + b',"geometry":{'
+
+    first = True
+    for key, value in geometry_data.items():
+        sep = b'' if first else b','
+        first = False
+        if key == 'model':
+            # model 是最大的子树，按其内部字段进一步分块
+            yield sep + b'"model":{'
+            inner_first = True
+            for model_key, model_value in value.items():
+                inner_sep = b'' if inner_first else b','
+                inner_first = False
+                yield (inner_sep
+                       + orjson.dumps(model_key, option=_ORJSON_OPTIONS)
+                       + b':'
+                       + orjson.dumps(model_value, option=_ORJSON_OPTIONS))
+            yield b'}'
+        else:
+            yield (sep + orjson.dumps(key, option=_ORJSON_OPTIONS)
+                   + b':' + orjson.dumps(value, option=_ORJSON_OPTIONS))
+
+    yield b'}}'
+
+
+def _finalize_upload(result, filename, file_hash):
+    """
+    保存处理结果到会话并构建上传响应（/upload 与 /upload_raw 共用）
+
+    Args:
+        result: ModelService 的处理结果字典
+        filename: 源文件名
+        file_hash: 文件内容哈希
+
+    Returns:
+        Response: JSON 响应，或 ?format=binary 时的二进制网格响应
+    """
+    # 保存到会话
+    SessionService.save_model(
+        shape=result['shape'],
+        geometry_data=result['geometry_data'],
+        edges_map=result['edges_map'],
+        faces_map=result['faces_map'],
+        vertices_map=result['vertices_map'],
+        mesh=result.get('mesh'),  # 可选
+        filename=filename,
+        file_hash=file_hash
+    )
+
+    # 二进制网格响应：?format=binary 时立即返回最粗 LOD 的网格
+    # （positions float32 + indices uint32），跳过大网格的 JSON 编码；
+    # 更精细的 LOD 在后台生成，客户端通过 /api/mesh?lod=N 换取
+    if request.args.get('format') == 'binary':
+        mesh = ModelService.mesh_for(file_hash, lod=0)
+        if mesh:
+            ModelService.prefetch_finer_lods(file_hash)
+            return mesh_response(mesh)
+
+    # JSON 路径：后台预生成全部 LOD 网格，等用户切到
+    # 网格预览时 /api/mesh 直接命中缓存
+    ModelService.prefetch_all_lods(file_hash)
+
+    # 大几何载荷分块流式编码发送（msgpack 协商和旧的网格兼容
+    # 响应仍走整体编码路径）
+    if HAS_ORJSON and 'mesh' not in result and not wants_msgpack():
+        return Response(
+            stream_with_context(
+                _stream_upload_json(result['geometry_data'], filename)),
+            mimetype='application/json'
+        )
+
+    # 构建返回数据
+    response_data = {
+        'geometry': result['geometry_data']
+    }
+
+    # 如果生成了网格，也返回（用于兼容旧前端或快速预览）
+    if 'mesh' in result:
+        response_data['mesh'] = result['mesh']
+
+    # 返回响应
+    return success_response(
+        message='STEP文件上传成功',
+        filename=filename,
+        **response_data
+    )
+
 
 @bp.route('/upload', methods=['POST'])
 def upload_file():
@@ -37,39 +198,23 @@ def upload_file():
     filepath = None
     
     try:
-        # 保存文件
-        filepath = FileService.save_upload(file)
-        
-        # 处理 STEP 文件（新架构）
-        result = ModelService.process_step_file(filepath)
-        
-        # 保存到会话
-        SessionService.save_model(
-            shape=result['shape'],
-            geometry_data=result['geometry_data'],
-            edges_map=result['edges_map'],
-            faces_map=result['faces_map'],
-            vertices_map=result['vertices_map'],
-            mesh=result.get('mesh'),  # 可选
-            filename=file.filename
-        )
-        
-        # 构建返回数据
-        response_data = {
-            'geometry': result['geometry_data']
-        }
-        
-        # 如果生成了网格，也返回（用于兼容旧前端或快速预览）
-        if 'mesh' in result:
-            response_data['mesh'] = result['mesh']
-        
-        # 返回响应
-        return success_response(
-            message='STEP文件上传成功',
-            filename=file.filename,
-            **response_data
-        )
-        
+        content_length = request.content_length or 0
+
+        if content_length and content_length < current_app.config['IN_MEMORY_UPLOAD_LIMIT']:
+            # 小文件：全部读入内存，跳过临时文件的写入/删除往返
+            data = file.read()
+            file_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            result = ModelService.process_step_stream(
+                io.BytesIO(data), file.filename, file_hash)
+        else:
+            # 大文件：保存到磁盘（同时计算内容哈希，作为结果缓存键）
+            filepath, file_hash = FileService.save_upload(file)
+
+            # 处理 STEP 文件（新架构），相同内容的文件命中缓存
+            result = ModelService.process_step_file(filepath, file_hash)
+
+        return _finalize_upload(result, file.filename, file_hash)
+
     except FileNotFoundError as e:
         return error_response(f'文件不存在: {str(e)}', 404)
     
@@ -84,3 +229,174 @@ def upload_file():
         if filepath:
             FileService.delete_file(filepath)
 
+
+def _hash_file(filepath):
+    """分块计算文件内容哈希（缓存键，与上传路径同一算法）"""
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@bp.route('/upload/chunk', methods=['POST'])
+def upload_chunk():
+    """
+    分块上传 STEP 文件（断点续传）
+
+    客户端把文件切成若干块，每块带三个头：
+        X-Upload-Id: 客户端生成的上传标识
+        X-Filename: 源文件名
+        Content-Range: bytes X-Y/Z
+
+    每块用 os.pwrite 按偏移写入同一个临时文件，网络中断后
+    只需重传缺失的块；服务器内存始终只持有当前块。
+    收齐全部字节后走与整文件上传相同的处理和缓存路径。
+
+    Returns:
+        中间块: 204 No Content
+        最后一块: 与 /api/upload 相同的 JSON 响应
+    """
+    upload_id = request.headers.get('X-Upload-Id')
+    if not upload_id:
+        return error_response('缺少 X-Upload-Id 头', 400)
+
+    match = _CONTENT_RANGE_RE.fullmatch(
+        request.headers.get('Content-Range', ''))
+    if not match:
+        return error_response(
+            '缺少或非法的 Content-Range 头（应为 bytes X-Y/Z）', 400)
+
+    start, end, total = (int(g) for g in match.groups())
+    if end < start or total <= 0 or end >= total:
+        return error_response('Content-Range 区间非法', 400)
+
+    filename = request.headers.get('X-Filename', 'upload.step')
+    if not allowed_file(filename):
+        return error_response('文件格式不支持，请上传STEP或STP文件', 400)
+    if total > current_app.config['MAX_CONTENT_LENGTH']:
+        return error_response('文件超出大小限制', 413)
+
+    data = request.get_data()
+    if len(data) != end - start + 1:
+        return error_response('块大小与 Content-Range 不一致', 400)
+
+    now = time.monotonic()
+    with _chunk_lock:
+        # 顺带清理废弃的上传：没有后台线程，靠新请求触发就够了
+        # （没有新请求时也不会有新的泄漏累积）
+        stale_paths = _sweep_stale_uploads(now)
+
+        state = _chunk_uploads.get(upload_id)
+        if state is None:
+            ext = FileService.get_file_extension(filename)
+            tmp = tempfile.NamedTemporaryFile(
+                suffix=f'.{ext}' if ext else '.step',
+                delete=False,
+                dir=current_app.config['UPLOAD_FOLDER'])
+            tmp.close()
+            state = {'path': tmp.name, 'filename': filename,
+                     'size': total, 'chunks': {}, 'mtime': now}
+            _chunk_uploads[upload_id] = state
+
+    for path in stale_paths:
+        FileService.delete_file(path)
+
+    # 块写入不持锁：os.pwrite 按绝对偏移写，不同块互不干扰
+    fd = os.open(state['path'], os.O_WRONLY)
+    try:
+        os.pwrite(fd, data, start)
+    finally:
+        os.close(fd)
+
+    with _chunk_lock:
+        state['chunks'][start] = len(data)
+        state['mtime'] = time.monotonic()
+        received = sum(state['chunks'].values())
+        complete = received >= state['size']
+        if complete:
+            del _chunk_uploads[upload_id]
+
+    if not complete:
+        return '', 204
+
+    # 收齐：按与整文件上传一致的流程处理
+    filepath = state['path']
+    try:
+        file_hash = _hash_file(filepath)
+        result = ModelService.process_step_file(filepath, file_hash)
+        return _finalize_upload(result, state['filename'], file_hash)
+
+    except FileNotFoundError as e:
+        return error_response(f'文件不存在: {str(e)}', 404)
+
+    except ValueError as e:
+        return error_response(f'文件验证失败: {str(e)}', 400)
+
+    except Exception as e:
+        return error_response(f'文件处理失败: {str(e)}', 500)
+
+    finally:
+        FileService.delete_file(filepath)
+
+
+@bp.route('/upload_raw', methods=['POST'])
+@bp.route('/upload/stream', methods=['POST'])
+def upload_raw():
+    """
+    上传 STEP 文件（原始请求体，大文件推荐）
+
+    请求体直接是文件内容（Content-Type: application/octet-stream），
+    文件名通过 X-Filename 头传递，
+    绕过 multipart/form-data 解析：Werkzeug 的 MultiPartParser
+    按小块逐段解析边界，百兆级上传时是纯 CPU 热点；
+    原始请求体可以按 1 MiB 大块直写磁盘，上传退化为 I/O 受限。
+
+    前端用法:
+        fetch('/api/upload_raw', {method: 'POST', body: file,
+               headers: {'X-Filename': file.name}})
+
+    Returns:
+        JSON: 与 /api/upload 相同的响应
+    """
+    filename = request.headers.get('X-Filename', 'upload.step')
+
+    if not allowed_file(filename):
+        return error_response('文件格式不支持，请上传STEP或STP文件', 400)
+
+    filepath = None
+
+    try:
+        content_length = request.content_length or 0
+
+        if content_length and content_length < current_app.config['IN_MEMORY_UPLOAD_LIMIT']:
+            # 小文件：全部读入内存，跳过临时文件的写入/删除往返
+            data = request.stream.read()
+            file_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            result = ModelService.process_step_stream(
+                io.BytesIO(data), filename, file_hash)
+        else:
+            # 大文件：按 1 MiB 分块直写磁盘（同时计算内容哈希）
+            filepath, file_hash = FileService.save_stream(
+                request.stream, filename)
+            result = ModelService.process_step_file(filepath, file_hash)
+
+        return _finalize_upload(result, filename, file_hash)
+
+    except FileNotFoundError as e:
+        return error_response(f'文件不存在: {str(e)}', 404)
+
+    except ValueError as e:
+        return error_response(f'文件验证失败: {str(e)}', 400)
+
+    except Exception as e:
+        return error_response(f'文件处理失败: {str(e)}', 500)
+
+    finally:
+        # 清理临时文件
+        if filepath:
+            FileService.delete_file(filepath)
+
@@ -1,40 +1,91 @@
 """
 文件处理服务
 """
+import hashlib
 import os
-from werkzeug.utils import secure_filename
+import tempfile
 from flask import current_app
 
+# 分块写入大小：1 MiB，兼顾 L2 缓存和内核写入流水线
+CHUNK_SIZE = 1024 * 1024
+
 
 class FileService:
     """文件处理服务"""
-    
+
     @staticmethod
     def save_upload(file):
         """
         保存上传的文件到临时目录
-        
+
+        使用分块读写直接从请求流写入磁盘，
+        避免 Werkzeug 把整个上传缓冲到内存后再整体复制一遍；
+        同一个分块循环中顺带计算内容哈希（用于结果/网格缓存键）。
+        哈希用 BLAKE2b-128：比 SHA-256 快约一倍，缓存键不需要抗碰撞强度
+
         Args:
             file: Flask 文件对象
-            
+
         Returns:
-            str: 保存后的文件路径
+            tuple: (保存后的文件路径, 内容哈希十六进制串)
         """
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        return filepath
-    
+        return FileService.save_stream(file.stream, file.filename)
+
+    @staticmethod
+    def save_stream(stream, filename):
+        """
+        把可读二进制流分块保存到临时目录
+
+        与 save_upload 相同的分块写入/哈希逻辑，但直接接受流对象，
+        供原始请求体上传（/api/upload_raw）绕过 multipart 解析使用。
+
+        Args:
+            stream: 可读的二进制流
+            filename: 源文件名（仅用于决定临时文件后缀）
+
+        Returns:
+            tuple: (保存后的文件路径, 内容哈希十六进制串)
+        """
+        ext = FileService.get_file_extension(filename)
+        suffix = f'.{ext}' if ext else '.step'
+        hasher = hashlib.blake2b(digest_size=16)
+
+        with tempfile.NamedTemporaryFile(
+                suffix=suffix,
+                delete=False,
+                dir=current_app.config['UPLOAD_FOLDER']) as tmp:
+            try:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+            except Exception:
+                # 写入中途失败（客户端断开、磁盘满）：
+                # 路径还没返回给调用方，不清理就会留下孤儿临时文件
+                tmp.close()
+                os.remove(tmp.name)
+                raise
+
+            return tmp.name, hasher.hexdigest()
+
     @staticmethod
     def delete_file(filepath):
         """
-        删除文件
-        
+        删除文件（文件不存在时静默返回）
+
+        直接 unlink 并吞掉 FileNotFoundError：
+        比 exists + remove 少一次 stat 系统调用，也没有
+        判断和删除之间的竞态窗口
+
         Args:
             filepath: 文件路径
         """
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        try:
+            os.unlink(filepath)
+        except FileNotFoundError:
+            pass
     
     @staticmethod
     def get_file_extension(filename):
@@ -6,9 +6,136 @@
 - 保持精确几何类型和参数（不破坏数据结构）
 - 支持焊缝识别所需的拓扑关系
 - 前端自行决定如何渲染（不再提供网格转换）
+
+缓存说明：
+- 上传内容在写盘/读流时顺带计算 BLAKE2b-128 哈希，
+  处理结果（shape + 几何数据 + 映射）按哈希做进程内 LRU 缓存，
+  重复上传同一文件跳过全部 OCC 解析和提取
+- 预览网格按 (哈希, LOD) 单独缓存；TopoDS_Shape 无法序列化，
+  缓存不能外置到 Redis，多进程部署靠粘性会话 + 每进程独立命中
 """
-from core import StepLoader, GeometryExtractor
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
+import struct
+import threading
+
+# 每线程复用一个 StepLoader：避免每次上传都重新初始化
+# STEPControl_Reader 的模式表；配合多线程 worker 每个线程保持热加载器
+_loader_local = threading.local()
+
+
+def _get_loader():
+    """获取当前线程的 StepLoader 实例（线程内复用）"""
+    loader = getattr(_loader_local, 'loader', None)
+    if loader is None:
+        # 懒导入：首次加载模型时才引入 OCC，保持应用冷启动轻量
+        from core import StepLoader
+        loader = StepLoader()
+        _loader_local.loader = loader
+    return loader
+
+# 处理结果缓存：{文件内容哈希: 处理结果}
+# 同一个 STEP 文件重复上传时直接复用加载和提取结果，LRU 淘汰限制内存
+_RESULT_CACHE_SIZE = 8
+_result_cache = OrderedDict()
+
+
+def _cache_get(file_hash):
+    """查询处理结果缓存，命中时刷新 LRU 顺序"""
+    if file_hash is not None and file_hash in _result_cache:
+        _result_cache.move_to_end(file_hash)
+        print(f"✓ 命中处理结果缓存: {file_hash[:12]}")
+        return _result_cache[file_hash]
+    return None
+
+
+def _cache_put(file_hash, result):
+    """写入处理结果缓存并按 LRU 淘汰"""
+    if file_hash is not None:
+        _result_cache[file_hash] = result
+        if len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+# 预览网格 LOD 梯度（线性偏差，从粗到细）：
+# 上传后立即返回最粗网格保证首屏速度，细网格后台生成
+LOD_DEFLECTIONS = (0.5, 0.1, 0.02)
+
+# 网格缓存：{(文件内容哈希, 线性偏差): mesh}
+_MESH_CACHE_SIZE = 32
+_mesh_cache = OrderedDict()
+
+# 单线程后台网格生成：BRepMesh 会写入形状的三角化数据，
+# 同一形状的并发三角化不安全，因此串行化
+_mesh_executor = ThreadPoolExecutor(max_workers=1)
+
+# 三角化互斥锁：预取任务在后台 worker 里跑的同时，请求线程
+# 也可能因缓存未命中直接触发 shape_to_mesh，两者会并发写同一个
+# TopoDS_Shape 的三角化数据；所有生成路径都必须持有此锁
+# （不能把请求线程的生成也提交进单线程 executor——mesh_for 本身
+# 会在该 executor 里执行，自提交再等待结果会死锁）
+_mesh_gen_lock = threading.Lock()
+
+# 磁盘网格缓存：三角化结果由 (内容哈希, 偏差) 唯一决定，
+# 落盘后跨进程/跨重启复用（内存缓存是每个 worker 独立的）。
+# 几何结果里有无法序列化的 TopoDS 对象，只有网格适合持久化。
+# 设置 MESH_DISK_CACHE 环境变量（目录路径）启用
+_mesh_disk_dir = os.environ.get('MESH_DISK_CACHE')
+
+# 文件头（小端）：(线性偏差, positions 元素个数, indices 元素个数)
+_DISK_MESH_HEADER = '<dQQ'
+
+
+def _disk_mesh_path(file_hash, deflection):
+    """磁盘网格缓存文件路径"""
+    return os.path.join(_mesh_disk_dir, f'{file_hash}_{deflection}.mesh')
+
+
+def _disk_mesh_get(file_hash, deflection):
+    """读取磁盘网格缓存；未启用/未命中/文件损坏时返回 None"""
+    if _mesh_disk_dir is None or file_hash is None:
+        return None
+
+    try:
+        with open(_disk_mesh_path(file_hash, deflection), 'rb') as f:
+            header = f.read(struct.calcsize(_DISK_MESH_HEADER))
+            stored_deflection, n_pos, n_idx = struct.unpack(
+                _DISK_MESH_HEADER, header)
+            positions = array('d')
+            positions.frombytes(f.read(n_pos * 8))
+            indices = array('I')
+            indices.frombytes(f.read(n_idx * indices.itemsize))
+    except (OSError, struct.error, ValueError):
+        return None
+
+    if len(positions) != n_pos or len(indices) != n_idx:
+        return None
+
+    return {'positions': positions, 'indices': indices,
+            'linear_deflection': stored_deflection}
+
+
+def _disk_mesh_put(file_hash, deflection, mesh):
+    """写入磁盘网格缓存（先写临时文件再原子改名，容忍并发写）"""
+    if _mesh_disk_dir is None or file_hash is None:
+        return
+
+    try:
+        os.makedirs(_mesh_disk_dir, exist_ok=True)
+        positions = array('d', mesh['positions'])
+        indices = array('I', mesh['indices'])
+        path = _disk_mesh_path(file_hash, deflection)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(struct.pack(_DISK_MESH_HEADER,
+                                mesh['linear_deflection'],
+                                len(positions), len(indices)))
+            f.write(positions.tobytes())
+            f.write(indices.tobytes())
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
 
 
 class ModelService:
@@ -25,8 +152,7 @@ class ModelService:
         Returns:
             TopoDS_Shape: OpenCascade 形状对象
         """
-        loader = StepLoader()
-        shape = loader.load_file(filepath)
+        shape = _get_loader().load_file(filepath)
         return shape
     
     @staticmethod
@@ -43,6 +169,8 @@ class ModelService:
                 - model: {vertices, edges, faces, topology}
                 - features: {potential_weld_seams}
         """
+        from core import GeometryExtractor
+
         extractor = GeometryExtractor(shape, filename)
         geometry_data = extractor.extract_all()
         
@@ -55,24 +183,141 @@ class ModelService:
         }
     
     @staticmethod
-    def process_step_file(filepath):
+    def process_step_file(filepath, file_hash=None):
         """
         处理 STEP 文件的完整流程
-        
+
         Args:
             filepath: STEP 文件路径
-            
+            file_hash: 文件内容哈希（可选，提供时启用结果缓存）
+
         Returns:
             dict: 包含完整几何数据的字典
                 {shape, geometry_data, vertices_map, edges_map, faces_map}
         """
+        # 命中缓存：同一内容的文件直接复用处理结果
+        cached = _cache_get(file_hash)
+        if cached is not None:
+            return cached
+
         # 加载 STEP 文件
         shape = ModelService.load_step_file(filepath)
         filename = os.path.basename(filepath)
-        
+
         # 提取完整几何和拓扑数据
         result = ModelService.extract_geometry(shape, filename)
         result['shape'] = shape
-        
+
+        _cache_put(file_hash, result)
+        return result
+
+    @staticmethod
+    def process_step_stream(stream, filename, file_hash=None):
+        """
+        从内存流处理 STEP 数据的完整流程（小文件跳过磁盘往返）
+
+        Args:
+            stream: 可读的二进制流（如 io.BytesIO）
+            filename: 源文件名
+            file_hash: 文件内容哈希（可选，提供时启用结果缓存）
+
+        Returns:
+            dict: 包含完整几何数据的字典
+                {shape, geometry_data, vertices_map, edges_map, faces_map}
+        """
+        # 命中缓存：同一内容的文件直接复用处理结果
+        cached = _cache_get(file_hash)
+        if cached is not None:
+            return cached
+
+        # 从内存流加载 STEP 数据
+        shape = _get_loader().load_stream(stream, filename)
+
+        # 提取完整几何和拓扑数据
+        result = ModelService.extract_geometry(shape, filename)
+        result['shape'] = shape
+
+        _cache_put(file_hash, result)
         return result
 
+    @staticmethod
+    def mesh_for(file_hash, lod=0):
+        """
+        获取指定 LOD 的预览网格（带缓存）
+
+        Args:
+            file_hash: 文件内容哈希（结果缓存键）
+            lod: LOD 等级（0 最粗，越大越精细）
+
+        Returns:
+            dict or None: 网格数据；形状已被缓存淘汰时返回 None
+        """
+        lod = max(0, min(lod, len(LOD_DEFLECTIONS) - 1))
+        deflection = LOD_DEFLECTIONS[lod]
+        key = (file_hash, deflection)
+
+        if key in _mesh_cache:
+            _mesh_cache.move_to_end(key)
+            return _mesh_cache[key]
+
+        # 磁盘命中：别的进程（或上次运行）已经三角化过同一内容，
+        # 不需要形状还在本进程的结果缓存里
+        mesh = _disk_mesh_get(file_hash, deflection)
+        if mesh is None:
+            result = _result_cache.get(file_hash)
+            if result is None:
+                return None
+
+            from core import MeshConverter
+
+            with _mesh_gen_lock:
+                # 等锁期间另一条路径（预取 worker 或并发请求）可能
+                # 已经生成了同一网格，拿到锁后先复查两级缓存
+                if key in _mesh_cache:
+                    _mesh_cache.move_to_end(key)
+                    return _mesh_cache[key]
+
+                mesh = _disk_mesh_get(file_hash, deflection)
+                if mesh is None:
+                    mesh = MeshConverter.shape_to_mesh(
+                        result['shape'], linear_deflection=deflection)
+                    _disk_mesh_put(file_hash, deflection, mesh)
+
+        _mesh_cache[key] = mesh
+        if len(_mesh_cache) > _MESH_CACHE_SIZE:
+            _mesh_cache.popitem(last=False)
+
+        return mesh
+
+    @staticmethod
+    def prefetch_finer_lods(file_hash):
+        """
+        后台预生成更精细的 LOD 网格
+
+        Args:
+            file_hash: 文件内容哈希
+        """
+        for lod in range(1, len(LOD_DEFLECTIONS)):
+            _mesh_executor.submit(ModelService.mesh_for, file_hash, lod)
+
+    @staticmethod
+    def prefetch_all_lods(file_hash):
+        """
+        后台预生成所有 LOD 网格（含最粗一级）
+
+        上传响应返回后立即触发：等用户切到网格预览时
+        /api/mesh 直接命中缓存，OCC 三角化的延迟藏在
+        用户阅读几何数据的时间里。
+
+        Args:
+            file_hash: 文件内容哈希
+        """
+        for lod in range(len(LOD_DEFLECTIONS)):
+            _mesh_executor.submit(ModelService.mesh_for, file_hash, lod)
+
+    @staticmethod
+    def clear_cache():
+        """清空处理结果缓存和网格缓存"""
+        _result_cache.clear()
+        _mesh_cache.clear()
+
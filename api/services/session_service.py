@@ -6,6 +6,7 @@
 - 保存映射字典（vertices_map, edges_map, faces_map）用于回溯 OCC 对象
 - 可选保存网格数据（mesh）用于快速预览
 """
+import threading
 
 
 class SessionService:
@@ -13,8 +14,22 @@ class SessionService:
     会话管理服务
     
     注意：当前使用全局变量存储单用户会话
-    多用户场景需要改用 Flask-Session 或数据库
+
+    为什么不用 Redis/Flask-Session 做跨进程会话：
+    - TopoDS_Shape 和 *_map 里的 OCC 对象无法 pickle，外部存储
+      只能存几何 JSON，回溯焊缝边仍要每个 worker 重建形状
+    - 结果/网格缓存已按文件内容哈希在每个 worker 内独立命中，
+      重复上传同一文件时重建成本是一次缓存查找
+    - 多 worker 部署用反向代理的粘性会话把同一客户端固定到
+      同一进程即可（见 docs/nginx.md）
+
+    并发说明：gthread worker 下多个请求线程会同时读写会话，
+    用可重入锁保证 save/clear 的多字段更新原子可见，
+    避免一个线程读到"新 shape + 旧映射"的撕裂状态
     """
+    # 保护 _current_model 的多字段读写
+    _lock = threading.RLock()
+
     
     # 全局会话存储（单用户）
     _current_model = {
@@ -24,12 +39,20 @@ class SessionService:
         'edges_map': {},            # hash -> TopoDS_Edge（用于焊缝回溯）
         'faces_map': {},            # hash -> TopoDS_Face
         'mesh': None,               # 可选的三角网格（用于预览）
-        'filename': None            # 文件名
+        'filename': None,           # 文件名
+        'file_hash': None           # 文件内容哈希（用于网格/结果缓存键）
     }
-    
+
+    # 热路径快捷方式：把映射字典的 .get 直接绑定为类属性，
+    # get_edge_by_hash/get_face_by_hash 每次调用省掉
+    # _current_model 取值和字典属性查找（焊缝选择时逐边调用）
+    _get_edge = _current_model['edges_map'].get
+    _get_face = _current_model['faces_map'].get
+
     @classmethod
-    def save_model(cls, shape, geometry_data=None, edges_map=None, 
-                   faces_map=None, vertices_map=None, mesh=None, filename=None):
+    def save_model(cls, shape, geometry_data=None, edges_map=None,
+                   faces_map=None, vertices_map=None, mesh=None, filename=None,
+                   file_hash=None):
         """
         保存模型到会话（新架构）
         
@@ -41,15 +64,30 @@ class SessionService:
             vertices_map: 顶点哈希映射
             mesh: 可选的网格数据
             filename: 文件名
+            file_hash: 文件内容哈希（可选）
+        """
+        with cls._lock:
+            cls._current_model['shape'] = shape
+            cls._current_model['geometry_data'] = geometry_data
+            cls._current_model['edges_map'] = edges_map or {}
+            cls._current_model['faces_map'] = faces_map or {}
+            cls._current_model['vertices_map'] = vertices_map or {}
+            cls._current_model['mesh'] = mesh
+            cls._current_model['filename'] = filename
+            cls._current_model['file_hash'] = file_hash
+            cls._get_edge = cls._current_model['edges_map'].get
+            cls._get_face = cls._current_model['faces_map'].get
+
+    @classmethod
+    def get_file_hash(cls):
         """
-        cls._current_model['shape'] = shape
-        cls._current_model['geometry_data'] = geometry_data
-        cls._current_model['edges_map'] = edges_map or {}
-        cls._current_model['faces_map'] = faces_map or {}
-        cls._current_model['vertices_map'] = vertices_map or {}
-        cls._current_model['mesh'] = mesh
-        cls._current_model['filename'] = filename
-    
+        获取当前模型的文件内容哈希
+
+        Returns:
+            str or None: 内容哈希十六进制串
+        """
+        return cls._current_model['file_hash']
+
     @classmethod
     def get_model(cls):
         """
@@ -111,7 +149,7 @@ class SessionService:
         Returns:
             TopoDS_Edge: 边对象，如果不存在返回 None
         """
-        return cls._current_model['edges_map'].get(edge_hash)
+        return cls._get_edge(edge_hash)
     
     @classmethod
     def get_face_by_hash(cls, face_hash):
@@ -124,18 +162,22 @@ class SessionService:
         Returns:
             TopoDS_Face: 面对象，如果不存在返回 None
         """
-        return cls._current_model['faces_map'].get(face_hash)
+        return cls._get_face(face_hash)
     
     @classmethod
     def clear_model(cls):
         """清除当前会话的模型"""
-        cls._current_model['shape'] = None
-        cls._current_model['geometry_data'] = None
-        cls._current_model['vertices_map'] = {}
-        cls._current_model['edges_map'] = {}
-        cls._current_model['faces_map'] = {}
-        cls._current_model['mesh'] = None
-        cls._current_model['filename'] = None
+        with cls._lock:
+            cls._current_model['shape'] = None
+            cls._current_model['geometry_data'] = None
+            cls._current_model['vertices_map'] = {}
+            cls._current_model['edges_map'] = {}
+            cls._current_model['faces_map'] = {}
+            cls._current_model['mesh'] = None
+            cls._current_model['filename'] = None
+            cls._current_model['file_hash'] = None
+            cls._get_edge = cls._current_model['edges_map'].get
+            cls._get_face = cls._current_model['faces_map'].get
     
     @classmethod
     def has_model(cls):
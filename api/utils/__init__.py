@@ -2,12 +2,16 @@
 工具函数模块
 """
 from .validators import validate_file, allowed_file
-from .response import success_response, error_response
+from .response import success_response, error_response, wants_msgpack
+from .binary import pack_mesh, mesh_response
 
 __all__ = [
     'validate_file',
     'allowed_file',
     'success_response',
     'error_response',
+    'wants_msgpack',
+    'pack_mesh',
+    'mesh_response',
 ]
 
@@ -0,0 +1,54 @@
+"""
+二进制网格序列化工具
+将预览网格打包为紧凑的二进制载荷（替代 ASCII JSON）
+
+载荷格式（小端）：
+- 头部: struct '<III' = (positions 浮点数个数, normals 浮点数个数, indices 个数)
+- positions: float32 数组
+- normals: float32 数组
+- indices: uint32 数组
+
+前端用 Three.js BufferGeometry 直接消费（Float32Array / Uint32Array 视图），
+相比 JSON 序列化省去数值转文本的 CPU 开销，字节数约降为 1/3
+"""
+import struct
+from flask import Response
+
+# 头部布局：positions/normals/indices 的元素个数
+_HEADER_FORMAT = '<III'
+
+
+def pack_mesh(mesh) -> bytes:
+    """
+    将网格字典打包为二进制载荷
+
+    Args:
+        mesh: 网格数据 {positions, normals, indices}
+
+    Returns:
+        bytes: 二进制载荷（头部 + 三段数组）
+    """
+    # 懒导入：该模块随 api.utils 在应用启动时加载，
+    # 顶层 import numpy 会把上百毫秒加进每个 worker 的冷启动
+    import numpy as np
+
+    positions = np.asarray(mesh.get('positions', []), dtype=np.float32).ravel()
+    normals = np.asarray(mesh.get('normals', []), dtype=np.float32).ravel()
+    indices = np.asarray(mesh.get('indices', []), dtype=np.uint32).ravel()
+
+    header = struct.pack(_HEADER_FORMAT, positions.size, normals.size, indices.size)
+
+    return header + positions.tobytes() + normals.tobytes() + indices.tobytes()
+
+
+def mesh_response(mesh) -> Response:
+    """
+    构建二进制网格响应
+
+    Args:
+        mesh: 网格数据 {positions, normals, indices}
+
+    Returns:
+        Response: application/octet-stream 响应
+    """
+    return Response(pack_mesh(mesh), mimetype='application/octet-stream')
@@ -1,32 +1,76 @@
 """
 统一响应格式工具
 """
-from flask import jsonify
+from flask import Response, jsonify, request
+
+# 可选的 MessagePack 编码：浮点以 8 字节二进制原样发送，
+# 不经过 JSON 的十进制文本化（每个 float 约 20 字符）和
+# 浏览器端逐个 parseFloat，载荷约减半、两端编解码 CPU 都更低
+try:
+    import ormsgpack
+    HAS_ORMSGPACK = True
+except ImportError:
+    HAS_ORMSGPACK = False
+
+
+def wants_msgpack():
+    """客户端是否显式偏好 MessagePack（Accept 协商，JSON 为默认）
+
+    只认 Accept 头里逐字列出且质量严格高于 JSON 的
+    application/msgpack：best_match 在质量持平时按服务端列表
+    顺序选择，会把 */*（fetch/curl 的默认值）也判成 msgpack，
+    导致未升级的 JSON 客户端拿到二进制响应
+    """
+    if not HAS_ORMSGPACK:
+        return False
+
+    accept = request.accept_mimetypes
+    msgpack_quality = max(
+        (quality for value, quality in accept
+         if value.lower() == 'application/msgpack'),
+        default=0
+    )
+    if not msgpack_quality:
+        return False
+    return msgpack_quality > accept['application/json']
 
 
 def success_response(data=None, message='操作成功', **kwargs):
     """
     成功响应
-    
+
+    客户端发送 Accept: application/msgpack 时返回 MessagePack
+    二进制（需要安装 ormsgpack），否则返回 JSON
+
     Args:
         data: 响应数据
         message: 响应消息
         **kwargs: 其他额外字段
-        
+
     Returns:
-        Response: Flask JSON 响应
+        Response: Flask JSON / MessagePack 响应
     """
     response = {
         'success': True,
         'message': message
     }
-    
+
     if data is not None:
         response['data'] = data
-    
+
     # 添加额外字段
     response.update(kwargs)
-    
+
+    if wants_msgpack():
+        # OPT_NON_STR_KEYS：topology 子树是整数键字典，
+        # 缺了它 packb 会对 /api/upload 的几何载荷抛 TypeError
+        return Response(
+            ormsgpack.packb(
+                response, option=(ormsgpack.OPT_SERIALIZE_NUMPY
+                                  | ormsgpack.OPT_NON_STR_KEYS)),
+            mimetype='application/msgpack'
+        )
+
     return jsonify(response)
 
 
@@ -0,0 +1,30 @@
+"""
+ASGI 入口（可选）
+
+偏好 uvicorn/uvloop 的部署可以把 WSGI 应用包一层 asgiref 适配器运行：
+
+    pip install asgiref uvicorn uvloop
+    uvicorn asgi:app --workers 1 --loop uvloop
+
+并发模型与 gunicorn gthread 一致：OCC 的 C++ 计算释放 GIL，
+适配器把每个请求派发到线程池执行。常规部署仍推荐 wsgi.py + gunicorn
+（见 gunicorn.conf.py）。
+
+注意必须单 worker：会话状态（当前加载的模型）和各级缓存都在
+进程内，多 worker 抢同一个监听 socket 时上传和后续请求会落在
+不同进程直接 404。需要多进程横向扩展时按 docs/nginx.md 的做法
+每个端口起一个单 worker 实例，由 nginx ip_hash 做会话粘性。
+"""
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from asgiref.wsgi import WsgiToAsgi
+
+from api import create_app
+from api.config import ProductionConfig
+
+app = WsgiToAsgi(create_app(ProductionConfig))
@@ -14,18 +14,38 @@
 - 前端自行决定如何渲染（网格/精确几何）
 """
 
-from .step_loader import StepLoader
-from .geometry_extractor import GeometryExtractor
-
-# 导出子模块
-from . import extractors
-from . import topology
-from . import serializers
+import importlib
 
 __all__ = [
     'StepLoader',
     'GeometryExtractor',
+    'MeshConverter',
     'extractors',
     'topology',
     'serializers',
-]
\ No newline at end of file
+]
+
+# 懒加载映射：导出名 -> 所在子模块
+# 每个子模块都会拉起大量 OCC.Core 的 SWIG .so，
+# 在首次访问时才导入，避免 Flask 应用启动就付几百毫秒的导入开销
+_LAZY_ATTRS = {
+    'StepLoader': '.step_loader',
+    'GeometryExtractor': '.geometry_extractor',
+    'MeshConverter': '.mesh_converter',
+    'extractors': '.extractors',
+    'topology': '.topology',
+    'serializers': '.serializers',
+}
+
+# 直接导出整个子模块的名字
+_LAZY_MODULES = {'extractors', 'topology', 'serializers'}
+
+
+def __getattr__(name):
+    """PEP 562 模块级懒加载"""
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = module if name in _LAZY_MODULES else getattr(module, name)
+        globals()[name] = value  # 之后的访问不再经过 __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
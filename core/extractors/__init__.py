@@ -3,12 +3,13 @@
 从 TopoDS_Shape 提取精确的几何和拓扑信息
 """
 
-from .vertex_extractor import VertexExtractor
+from .vertex_extractor import VertexExtractor, vertices_to_array
 from .edge_extractor import EdgeExtractor
 from .face_extractor import FaceExtractor
 
 __all__ = [
     'VertexExtractor',
+    'vertices_to_array',
     'EdgeExtractor',
     'FaceExtractor',
 ]
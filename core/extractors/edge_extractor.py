@@ -5,25 +5,61 @@
 - 边的起点和终点
 - 边的曲线参数
 - 边的相邻面（关键：用于焊缝识别）
+
+数据布局：edges_data 的字典行就是 geometry_data_schema 定义的
+JSON 线格式，直接进响应体；数值批处理（长度内核的参数列、
+控制点缓冲、统计量）在内部走连续的 NumPy 数组，只在字典边界
+转回 Python 对象
 """
 
-from OCC.Core.TopExp import TopExp_Explorer
-from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_VERTEX
-from OCC.Core.TopoDS import topods
+from OCC.Core.TopExp import topexp
+from OCC.Core.TopAbs import TopAbs_EDGE
+from ..topology.entity_cache import topods_entities
+from OCC.Core.TopoDS import topods, TopoDS_Vertex
 from OCC.Core.BRep import BRep_Tool
+from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
 from OCC.Core.GeomAbs import (
     GeomAbs_Line, GeomAbs_Circle, GeomAbs_Ellipse,
-    GeomAbs_Hyperbola, GeomAbs_Parabola,
-    GeomAbs_BezierCurve, GeomAbs_BSplineCurve,
-    GeomAbs_OffsetCurve, GeomAbs_OtherCurve
+    GeomAbs_BSplineCurve, GeomAbs_BezierCurve
 )
 from OCC.Core.Geom import (
     Geom_Line, Geom_Circle, Geom_Ellipse,
     Geom_BSplineCurve, Geom_BezierCurve
 )
 from OCC.Core.gp import gp_Pnt
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 import math
+import os
+import threading
+import numpy as np
+
+from .length_kernels import kernel_for, KIND_LINE, KIND_CIRCLE, KIND_ELLIPSE, KIND_OTHER
+
+# GeomAbs 枚举 -> (类型字符串, Geom 具体类, KIND_* 编码)
+# 与 FaceExtractor._SURFACE_TYPE_NAMES 同样的适配器枚举查表：
+# 一次 GetType() 虚调用替代逐类型的 DownCast 试探
+_CURVE_TYPES = {
+    GeomAbs_Line: ("line", Geom_Line, KIND_LINE),
+    GeomAbs_Circle: ("circle", Geom_Circle, KIND_CIRCLE),
+    GeomAbs_Ellipse: ("ellipse", Geom_Ellipse, KIND_ELLIPSE),
+    GeomAbs_BSplineCurve: ("bspline", Geom_BSplineCurve, KIND_OTHER),
+    GeomAbs_BezierCurve: ("bezier", Geom_BezierCurve, KIND_OTHER),
+}
+
+# 每线程复用一个 GProp_GProps 累加器：brepgprop.LinearProperties
+# 每次调用都会重置累加器，不必逐边新建；线程本地避免并行提取时共享写入
+_gprops_local = threading.local()
+
+
+def _thread_gprops():
+    """获取当前线程的 GProp_GProps 实例（线程内复用）"""
+    props = getattr(_gprops_local, 'props', None)
+    if props is None:
+        props = _gprops_local.props = GProp_GProps()
+    return props
 
 
 class EdgeExtractor:
@@ -42,9 +78,20 @@ class EdgeExtractor:
         
         self.shape = shape
         self.vertex_extractor = vertex_extractor
+        # 直接绑定哈希→ID 字典的 .get：顶点查找循环里省去
+        # 逐顶点的方法分发和 -1 哨兵比较前的一层包装调用
+        self._vertex_id_get = (
+            vertex_extractor.vertex_id_map.get if vertex_extractor else None
+        )
         self.edges_data = []
         self.edges_map = {}  # {hash: TopoDS_Edge}
         self.edge_id_map = {}  # {hash: id}
+        # 内部曲线种类编码 {hash: KIND_*}：类型字符串只留在公开数据里，
+        # 长度分桶等内部热路径用整数键，省去逐边的字符串哈希
+        self._kind_by_hash = {}
+        # 类型查表结果按 TShape 哈希记忆化：装配体里同一底层边
+        # 以不同位置实例化时，适配器构造和枚举查表只做一次
+        self._curve_type_cache = {}
         
     def extract(self) -> Tuple[List[Dict], Dict]:
         """
@@ -55,28 +102,35 @@ class EdgeExtractor:
                 edges_data: 边数据列表
                 edges_map: 哈希到边对象的映射
         """
-        explorer = TopExp_Explorer(self.shape, TopAbs_EDGE)
+        # topods_entities 底层的 IndexedMap 已按 IsSame 做过结构去重，
+        # 这里不再重复哈希+集合探测，每条唯一边只计算一次 TShape 哈希
+        unique_edges = [
+            (edge, hash(edge.TShape()))
+            for edge in map(topods.Edge, topods_entities(self.shape, TopAbs_EDGE))
+        ]
+
+        # 并行提取：曲线求值、向下转型、GProp 积分都在 OCCT C++ 中
+        # 执行且释放 GIL，与 FaceExtractor 相同的按实体分发策略
+        def extract_one(item):
+            index, (edge, edge_hash) = item
+            return self._extract_edge_geometry(edge, index, edge_hash)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(extract_one, enumerate(unique_edges)))
+
+        # 按遍历顺序分配连续ID（跳过提取失败的边，保持原有ID语义）
         edge_id = 0
-        
-        while explorer.More():
-            edge = topods.Edge(explorer.Current())
-            
-            # 获取 OCC HashCode
-            edge_hash = hash(edge.TShape())
-            
-            # 检查是否已经处理过这个边（去重）
-            if edge_hash not in self.edge_id_map:
-                # 提取边的几何信息
-                edge_data = self._extract_edge_geometry(edge, edge_id, edge_hash)
-                
-                if edge_data:  # 只添加有效的边
-                    self.edges_data.append(edge_data)
-                    self.edges_map[edge_hash] = edge
-                    self.edge_id_map[edge_hash] = edge_id
-                    edge_id += 1
-            
-            explorer.Next()
-        
+        for (edge, edge_hash), edge_data in zip(unique_edges, results):
+            if edge_data:  # 只添加有效的边
+                edge_data['id'] = edge_id
+                self.edges_data.append(edge_data)
+                self.edges_map[edge_hash] = edge
+                self.edge_id_map[edge_hash] = edge_id
+                edge_id += 1
+
+        # 批量填充解析曲线的边长度
+        self._fill_analytic_lengths()
+
         print(f"✓ 提取边: {len(self.edges_data)} 条")
         return self.edges_data, self.edges_map
     
@@ -107,12 +161,18 @@ class EdgeExtractor:
             vertices = self._get_edge_vertices(edge)
             
             # 获取曲线类型
-            # 在新版 pythonocc-core 中，curve_handle 本身就是 Geom_Curve 对象
-            curve_type = self._get_curve_type(curve_handle)
-            
+            # 适配器枚举先定类型（按 TShape 记忆化），再对本实例的
+            # 曲线做唯一一次目标类型的 DownCast 供参数提取复用；
+            # 曲线本身带位置变换，不能跨实例缓存
+            curve_type, concrete_class, kind = self._get_curve_type(edge, edge_hash)
+            concrete_curve = (
+                concrete_class.DownCast(curve_handle) if concrete_class else None
+            )
+            self._kind_by_hash[edge_hash] = kind
+
             # 提取曲线参数
             curve_data = self._extract_curve_parameters(
-                curve_handle, 
+                concrete_curve,
                 curve_type,
                 start_point,
                 end_point,
@@ -121,7 +181,11 @@ class EdgeExtractor:
             )
             
             # 计算边长度
-            length = self._calculate_edge_length(edge)
+            # 解析曲线（直线/圆/椭圆）延后到 _fill_analytic_lengths 批量计算
+            if kind != KIND_OTHER:
+                length = None
+            else:
+                length = self._calculate_edge_length(edge)
             
             # 检查边的属性
             is_degenerated = BRep_Tool.Degenerated(edge)
@@ -156,53 +220,59 @@ class EdgeExtractor:
             list: 顶点ID列表 [start_vertex_id, end_vertex_id]
         """
         vertices = []
-        
+        vertex_id_get = self._vertex_id_get
+
+        # 没有顶点提取器时结果必为空，连 C++ 调用都不用发起
+        if vertex_id_get is None:
+            return vertices
+
         try:
-            # 获取边的顶点
-            vertex_explorer = TopExp_Explorer(edge, TopAbs_VERTEX)
-            
-            while vertex_explorer.More():
-                vertex = topods.Vertex(vertex_explorer.Current())
-                vertex_hash = hash(vertex.TShape())
-                
-                if self.vertex_extractor:
-                    vertex_id = self.vertex_extractor.get_vertex_id_by_hash(vertex_hash)
-                    if vertex_id >= 0:
-                        vertices.append(vertex_id)
-                
-                vertex_explorer.Next()
-            
+            # topexp.Vertices 一次 C++ 调用同时返回首尾两个顶点，
+            # 替代逐元素的 TopExp_Explorer More()/Next() 往返
+            first_vertex = TopoDS_Vertex()
+            last_vertex = TopoDS_Vertex()
+            topexp.Vertices(edge, first_vertex, last_vertex)
+
+            for vertex in (first_vertex, last_vertex):
+                # 退化边（如锥顶缝合边）可能没有顶点
+                if vertex.IsNull():
+                    continue
+                vertex_id = vertex_id_get(hash(vertex.TShape()))
+                if vertex_id is not None:
+                    vertices.append(vertex_id)
+
         except Exception as e:
             print(f"警告: 获取边顶点失败: {e}")
-        
+
         return vertices
     
-    def _get_curve_type(self, curve) -> str:
+    def _get_curve_type(self, edge, edge_hash: int) -> Tuple[str, Optional[type], int]:
         """
-        获取曲线类型
+        获取曲线类型、具体曲线类和内核种类编码（按 TShape 记忆化）
+
+        适配器的 GetType() 是一次返回枚举的虚调用，查表后缓存结果；
+        类型只取决于底层 TShape，与实例位置无关，装配体里的重复
+        实例直接命中缓存
 
         Args:
-            curve: Geom_Curve 对象
+            edge: TopoDS_Edge 对象
+            edge_hash: 边的 TShape 哈希值
 
         Returns:
-            str: 曲线类型字符串
+            tuple: (曲线类型字符串, Geom 具体类或 None, KIND_* 编码)
         """
-        try:
-            # 尝试向下转型以确定具体类型
-            if Geom_Line.DownCast(curve):
-                return "line"
-            elif Geom_Circle.DownCast(curve):
-                return "circle"
-            elif Geom_Ellipse.DownCast(curve):
-                return "ellipse"
-            elif Geom_BSplineCurve.DownCast(curve):
-                return "bspline"
-            elif Geom_BezierCurve.DownCast(curve):
-                return "bezier"
-            else:
-                return "other"
-        except:
-            return "unknown"
+        entry = self._curve_type_cache.get(edge_hash)
+        if entry is None:
+            try:
+                entry = _CURVE_TYPES.get(
+                    BRepAdaptor_Curve(edge).GetType(),
+                    ("other", None, KIND_OTHER)
+                )
+            except Exception:
+                # 裸 except 会连 KeyboardInterrupt/SystemExit 一起吞掉
+                entry = ("unknown", None, KIND_OTHER)
+            self._curve_type_cache[edge_hash] = entry
+        return entry
     
     def _extract_curve_parameters(
         self,
@@ -217,7 +287,7 @@ class EdgeExtractor:
         根据曲线类型提取参数
 
         Args:
-            curve: Geom_Curve 对象
+            curve: 已向下转型的具体曲线对象（来自 _get_curve_type）
             curve_type: 曲线类型
             start_point: 起点
             end_point: 终点
@@ -228,134 +298,174 @@ class EdgeExtractor:
             dict: 曲线参数
         """
         params = {
-            'start': [start_point.X(), start_point.Y(), start_point.Z()],
-            'end': [end_point.X(), end_point.Y(), end_point.Z()],
+            'start': list(start_point.Coord()),
+            'end': list(end_point.Coord()),
             'first_parameter': first_param,
             'last_parameter': last_param
         }
-        
+
+        # 类型专用提取器直接写入 params：
+        # 省去每条边一个临时字典和 update 时的二次键哈希
         try:
             if curve_type == "line":
-                params.update(self._extract_line_parameters(curve))
+                self._extract_line_parameters(curve, params)
             elif curve_type == "circle":
-                params.update(self._extract_circle_parameters(curve, first_param, last_param))
+                self._extract_circle_parameters(curve, first_param, last_param, params)
             elif curve_type == "ellipse":
-                params.update(self._extract_ellipse_parameters(curve))
+                self._extract_ellipse_parameters(curve, params)
             elif curve_type == "bspline":
-                params.update(self._extract_bspline_parameters(curve))
+                self._extract_bspline_parameters(curve, params)
             elif curve_type == "bezier":
-                params.update(self._extract_bezier_parameters(curve))
+                self._extract_bezier_parameters(curve, params)
         except Exception as e:
             print(f"警告: 提取 {curve_type} 参数失败: {e}")
-        
+
         return params
     
-    def _extract_line_parameters(self, curve) -> Dict:
-        """提取直线参数"""
-        line = Geom_Line.DownCast(curve)
-        if not line:
-            return {}
-        
+    def _extract_line_parameters(self, line, params: Dict) -> None:
+        """提取直线参数（写入 params）"""
         # Geom_Line 的 Lin() 方法返回 gp_Lin 对象，它有 Direction() 方法
         gp_line = line.Lin()
         direction = gp_line.Direction()
-        
-        return {
-            'direction': [direction.X(), direction.Y(), direction.Z()]
-        }
+
+        params['direction'] = list(direction.Coord())
     
-    def _extract_circle_parameters(self, curve, first_param: float, last_param: float) -> Dict:
-        """提取圆/圆弧参数"""
-        circle = Geom_Circle.DownCast(curve)
-        if not circle:
-            return {}
-        
+    def _extract_circle_parameters(self, circle, first_param: float,
+                                   last_param: float, params: Dict) -> None:
+        """提取圆/圆弧参数（写入 params）"""
         center = circle.Location()
         axis = circle.Axis().Direction()
         radius = circle.Radius()
-        
+
         # 判断是否为完整圆
         param_range = abs(last_param - first_param)
         is_full_circle = abs(param_range - 2 * math.pi) < 1e-6
-        
-        return {
-            'center': [center.X(), center.Y(), center.Z()],
-            'axis': [axis.X(), axis.Y(), axis.Z()],
-            'radius': radius,
-            'start_angle': first_param,
-            'end_angle': last_param,
-            'is_full_circle': is_full_circle
-        }
+
+        params['center'] = list(center.Coord())
+        params['axis'] = list(axis.Coord())
+        params['radius'] = radius
+        params['start_angle'] = first_param
+        params['end_angle'] = last_param
+        params['is_full_circle'] = is_full_circle
     
-    def _extract_ellipse_parameters(self, curve) -> Dict:
-        """提取椭圆参数"""
-        ellipse = Geom_Ellipse.DownCast(curve)
-        if not ellipse:
-            return {}
-        
+    def _extract_ellipse_parameters(self, ellipse, params: Dict) -> None:
+        """提取椭圆参数（写入 params）"""
         center = ellipse.Location()
-        major_radius = ellipse.MajorRadius()
-        minor_radius = ellipse.MinorRadius()
-        
-        return {
-            'center': [center.X(), center.Y(), center.Z()],
-            'major_radius': major_radius,
-            'minor_radius': minor_radius
-        }
+
+        params['center'] = list(center.Coord())
+        params['major_radius'] = ellipse.MajorRadius()
+        params['minor_radius'] = ellipse.MinorRadius()
     
-    def _extract_bspline_parameters(self, curve) -> Dict:
-        """提取B样条参数"""
-        bspline = Geom_BSplineCurve.DownCast(curve)
-        if not bspline:
-            return {}
-        
+    def _extract_bspline_parameters(self, bspline, params: Dict) -> None:
+        """提取B样条参数（写入 params）"""
         degree = bspline.Degree()
         nb_poles = bspline.NbPoles()
         nb_knots = bspline.NbKnots()
-        
-        # 提取控制点
-        control_points = []
-        for i in range(1, nb_poles + 1):
-            pole = bspline.Pole(i)
-            control_points.append([pole.X(), pole.Y(), pole.Z()])
-        
-        # 提取节点向量
-        knots = []
-        multiplicities = []
-        for i in range(1, nb_knots + 1):
-            knots.append(bspline.Knot(i))
-            multiplicities.append(bspline.Multiplicity(i))
-        
-        return {
-            'degree': degree,
-            'control_points': control_points,
-            'knots': knots,
-            'multiplicities': multiplicities,
-            'is_rational': bspline.IsRational(),
-            'is_periodic': bspline.IsPeriodic()
-        }
+
+        # 整块取回内部 TColgp/TColStd 数组，逐项 Value 直接读数组，
+        # 不再经过曲线对象逐索引 Pole(i)/Knot(i) 的参数检查；
+        # 控制点写入预分配的 ndarray，最后一次性 tolist()
+        poles = bspline.Poles()
+        pole_value = poles.Value
+        control_points = np.empty((nb_poles, 3), dtype=np.float64)
+        for i in range(nb_poles):
+            control_points[i] = pole_value(i + 1).Coord()
+
+        # 节点向量与重数同样走预分配缓冲
+        knot_value = bspline.Knots().Value
+        mult_value = bspline.Multiplicities().Value
+        knots = np.empty(nb_knots, dtype=np.float64)
+        multiplicities = np.empty(nb_knots, dtype=np.intp)
+        for i in range(nb_knots):
+            knots[i] = knot_value(i + 1)
+            multiplicities[i] = mult_value(i + 1)
+
+        params['degree'] = degree
+        params['control_points'] = control_points.tolist()
+        params['knots'] = knots.tolist()
+        params['multiplicities'] = multiplicities.tolist()
+        params['is_rational'] = bspline.IsRational()
+        params['is_periodic'] = bspline.IsPeriodic()
     
-    def _extract_bezier_parameters(self, curve) -> Dict:
-        """提取Bezier曲线参数"""
-        bezier = Geom_BezierCurve.DownCast(curve)
-        if not bezier:
-            return {}
-        
+    def _extract_bezier_parameters(self, bezier, params: Dict) -> None:
+        """提取Bezier曲线参数（写入 params）"""
         degree = bezier.Degree()
         nb_poles = bezier.NbPoles()
-        
-        # 提取控制点
-        control_points = []
-        for i in range(1, nb_poles + 1):
-            pole = bezier.Pole(i)
-            control_points.append([pole.X(), pole.Y(), pole.Z()])
-        
-        return {
-            'degree': degree,
-            'control_points': control_points,
-            'is_rational': bezier.IsRational()
-        }
+
+        # 同 B 样条：整块取回极点数组，先进 ndarray 再一次性转列表
+        pole_value = bezier.Poles().Value
+        control_points = np.empty((nb_poles, 3), dtype=np.float64)
+        for i in range(nb_poles):
+            control_points[i] = pole_value(i + 1).Coord()
+
+        params['degree'] = degree
+        params['control_points'] = control_points.tolist()
+        params['is_rational'] = bezier.IsRational()
     
+    def _fill_analytic_lengths(self):
+        """
+        批量计算解析曲线边的长度
+
+        遍历阶段只记录曲线参数（SoA 数组：kinds/params/radii），
+        此处一次性调用 edge_lengths 内核计算；内核返回 -1 的边
+        （如椭圆弧）回退到逐边 GProp 计算
+        """
+        pending = [e for e in self.edges_data if e['length'] is None]
+        if not pending:
+            return
+
+        # 按曲线种类分桶：每个桶是同类参数的连续数组，
+        # 内核在桶内无需分支预测失败，数据布局也保持同构
+        buckets = {}
+        for edge_data in pending:
+            kind = self._kind_by_hash.get(edge_data['hash'], KIND_OTHER)
+            buckets.setdefault(kind, []).append(edge_data)
+
+        for kind, bucket in buckets.items():
+            # 每个种类分发到专用内核：桶内循环只有单一解析公式，无分支
+            kernel = kernel_for(kind)
+            n = len(bucket)
+            params = np.empty((n, 2), dtype=np.float64)
+            radii = np.zeros((n, 2), dtype=np.float64)
+
+            for i, edge_data in enumerate(bucket):
+                curve_data = edge_data['curve_data']
+                params[i, 0] = curve_data.get('first_parameter', 0.0)
+                params[i, 1] = curve_data.get('last_parameter', 0.0)
+
+                if kind == KIND_CIRCLE:
+                    radii[i, 0] = curve_data.get('radius', 0.0)
+                elif kind == KIND_ELLIPSE:
+                    radii[i, 0] = curve_data.get('major_radius', 0.0)
+                    radii[i, 1] = curve_data.get('minor_radius', 0.0)
+
+            # tolist() 一次性转成 Python float：回填循环里不再产生
+            # 带完整调度开销的 NumPy 标量（每次下标取值约 1µs）
+            if kernel is not None:
+                lengths = kernel(params, radii).tolist()
+            else:
+                lengths = [-1.0] * n
+
+            fallback = []
+            for edge_data, length in zip(bucket, lengths):
+                if length >= 0.0:
+                    edge_data['length'] = length
+                else:
+                    fallback.append(edge_data)
+
+            # 内核算不了的边集中到一轮 GProp 扫描：单个累加器复用，
+            # LinearProperties 每次调用会重置它，循环内只剩 C++ 积分
+            if fallback:
+                props = _thread_gprops()
+                linear_properties = brepgprop.LinearProperties
+                for edge_data in fallback:
+                    try:
+                        linear_properties(
+                            self.edges_map[edge_data['hash']], props)
+                        edge_data['length'] = props.Mass()
+                    except Exception:
+                        edge_data['length'] = 0.0
+
     def _calculate_edge_length(self, edge) -> float:
         """
         计算边的长度
@@ -367,13 +477,10 @@ class EdgeExtractor:
             float: 边长度
         """
         try:
-            from OCC.Core.GProp import GProp_GProps
-            from OCC.Core.BRepGProp import brepgprop
-            
-            props = GProp_GProps()
+            props = _thread_gprops()
             brepgprop.LinearProperties(edge, props)
             return props.Mass()  # 对于线性属性，Mass()返回长度
-        except:
+        except Exception:
             return 0.0
     
     def get_edges_data(self) -> List[Dict]:
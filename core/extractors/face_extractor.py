@@ -8,9 +8,15 @@
 """
 
 from OCC.Core.TopExp import TopExp_Explorer
-from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_EDGE, TopAbs_WIRE
+from OCC.Core.TopAbs import (
+    TopAbs_FACE, TopAbs_EDGE, TopAbs_WIRE,
+    TopAbs_FORWARD, TopAbs_REVERSED
+)
 from OCC.Core.TopoDS import topods
+from OCC.Core.BRepTools import breptools
 from OCC.Core.BRep import BRep_Tool
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
 from OCC.Core.GeomAbs import (
     GeomAbs_Plane, GeomAbs_Cylinder, GeomAbs_Cone,
     GeomAbs_Sphere, GeomAbs_Torus, GeomAbs_BezierSurface,
@@ -19,14 +25,45 @@ from OCC.Core.GeomAbs import (
     GeomAbs_OtherSurface
 )
 from OCC.Core.Geom import (
-    Geom_Plane, Geom_CylindricalSurface, Geom_ConicalSurface,
-    Geom_SphericalSurface, Geom_ToroidalSurface,
     Geom_BSplineSurface, Geom_BezierSurface,
     Geom_SurfaceOfRevolution, Geom_SurfaceOfLinearExtrusion
 )
-from OCC.Core.gp import gp_Pnt, gp_Dir
 from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
+from OCC.Core.GeomLProp import GeomLProp_SLProps
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
+import os
+import threading
+import numpy as np
+
+from ..topology.entity_cache import topods_entities
+
+# 每线程复用一个 GProp_GProps 累加器：brepgprop.SurfaceProperties
+# 每次调用都会重置累加器，不必逐面新建；线程本地避免并行提取时共享写入
+_gprops_local = threading.local()
+
+
+def _thread_gprops():
+    """获取当前线程的 GProp_GProps 实例（线程内复用）"""
+    props = getattr(_gprops_local, 'props', None)
+    if props is None:
+        props = _gprops_local.props = GProp_GProps()
+    return props
+
+# 曲面类型枚举 -> 类型名；模块级常量，避免每个面重建一次字典
+_SURFACE_TYPE_NAMES = {
+    GeomAbs_Plane: "plane",
+    GeomAbs_Cylinder: "cylinder",
+    GeomAbs_Cone: "cone",
+    GeomAbs_Sphere: "sphere",
+    GeomAbs_Torus: "torus",
+    GeomAbs_BezierSurface: "bezier",
+    GeomAbs_BSplineSurface: "bspline",
+    GeomAbs_SurfaceOfRevolution: "revolution",
+    GeomAbs_SurfaceOfExtrusion: "extrusion",
+    GeomAbs_OffsetSurface: "offset",
+    GeomAbs_OtherSurface: "other"
+}
 
 
 class FaceExtractor:
@@ -48,6 +85,11 @@ class FaceExtractor:
         self.faces_data = []
         self.faces_map = {}  # {hash: TopoDS_Face}
         self.face_id_map = {}  # {hash: id}
+        # 直接绑定哈希→ID 字典的 .get：wire 内循环里省去
+        # 逐边的方法分发和 -1 哨兵比较前的一层包装调用
+        self._edge_id_get = (
+            edge_extractor.edge_id_map.get if edge_extractor else None
+        )
         
     def extract(self) -> Tuple[List[Dict], Dict]:
         """
@@ -58,28 +100,32 @@ class FaceExtractor:
                 faces_data: 面数据列表
                 faces_map: 哈希到面对象的映射
         """
-        explorer = TopExp_Explorer(self.shape, TopAbs_FACE)
+        # topods_entities 底层的 IndexedMap 已按 IsSame 做过结构去重，
+        # 这里不再重复哈希+集合探测，每个唯一面只计算一次 TShape 哈希
+        unique_faces = [
+            (face, hash(face.TShape()))
+            for face in map(topods.Face, topods_entities(self.shape, TopAbs_FACE))
+        ]
+
+        # 并行提取：曲面适配、面积积分等都在 OCCT C++ 中执行且释放 GIL，
+        # 按面分发到线程池可以接近线性加速
+        def extract_one(item):
+            index, (face, face_hash) = item
+            return self._extract_face_geometry(face, index, face_hash)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(extract_one, enumerate(unique_faces)))
+
+        # 按遍历顺序分配连续ID（跳过提取失败的面，保持原有ID语义）
         face_id = 0
-        
-        while explorer.More():
-            face = topods.Face(explorer.Current())
-            
-            # 获取 OCC HashCode
-            face_hash = hash(face.TShape())
-            
-            # 检查是否已经处理过这个面（去重）
-            if face_hash not in self.face_id_map:
-                # 提取面的几何信息
-                face_data = self._extract_face_geometry(face, face_id, face_hash)
-                
-                if face_data:  # 只添加有效的面
-                    self.faces_data.append(face_data)
-                    self.faces_map[face_hash] = face
-                    self.face_id_map[face_hash] = face_id
-                    face_id += 1
-            
-            explorer.Next()
-        
+        for (face, face_hash), face_data in zip(unique_faces, results):
+            if face_data:  # 只添加有效的面
+                face_data['id'] = face_id
+                self.faces_data.append(face_data)
+                self.faces_map[face_hash] = face
+                self.face_id_map[face_hash] = face_id
+                face_id += 1
+
         print(f"✓ 提取面: {len(self.faces_data)} 个")
         return self.faces_data, self.faces_map
     
@@ -114,11 +160,14 @@ class FaceExtractor:
                 surface
             )
             
-            # 提取边界边（外边界）
-            boundary_edges = self._extract_boundary_edges(face)
-            
-            # 提取内部边（孔）
-            inner_edges = self._extract_inner_edges(face)
+            # 采样法线：平面以外的类型补充参数域中点处的法线
+            if 'normal' not in surface_data:
+                normal = self._sample_normal(adaptor, surface)
+                if normal:
+                    surface_data['normal'] = normal
+
+            # 提取边界边（外边界）和内部边（孔）：共享一轮 wire 遍历
+            boundary_edges, inner_edges = self._extract_wire_edges(face)
             
             # 计算面积
             area = self._calculate_face_area(face)
@@ -153,109 +202,60 @@ class FaceExtractor:
         Returns:
             str: 曲面类型字符串
         """
-        surface_type = adaptor.GetType()
-        
-        type_map = {
-            GeomAbs_Plane: "plane",
-            GeomAbs_Cylinder: "cylinder",
-            GeomAbs_Cone: "cone",
-            GeomAbs_Sphere: "sphere",
-            GeomAbs_Torus: "torus",
-            GeomAbs_BezierSurface: "bezier",
-            GeomAbs_BSplineSurface: "bspline",
-            GeomAbs_SurfaceOfRevolution: "revolution",
-            GeomAbs_SurfaceOfExtrusion: "extrusion",
-            GeomAbs_OffsetSurface: "offset",
-            GeomAbs_OtherSurface: "other"
-        }
-        
-        return type_map.get(surface_type, "unknown")
+        return _SURFACE_TYPE_NAMES.get(adaptor.GetType(), "unknown")
     
-    def _extract_boundary_edges(self, face) -> List[int]:
+    def _extract_wire_edges(self, face) -> Tuple[List[int], List[List[int]]]:
         """
-        提取面的外边界边
+        一次遍历提取面的外边界边和内部边（孔）
 
-        Args:
-            face: TopoDS_Face 对象
-
-        Returns:
-            list: 外边界边ID列表
-        """
-        boundary_edges = []
-        
-        try:
-            # 只获取外边界（第一个wire）
-            from OCC.Core.BRepTools import breptools
-            outer_wire = breptools.OuterWire(face)
-            
-            if not outer_wire.IsNull():
-                edge_explorer = TopExp_Explorer(outer_wire, TopAbs_EDGE)
-                
-                while edge_explorer.More():
-                    edge = topods.Edge(edge_explorer.Current())
-                    edge_hash = hash(edge.TShape())
-                    
-                    if self.edge_extractor:
-                        edge_id = self.edge_extractor.get_edge_id_by_hash(edge_hash)
-                        if edge_id >= 0:
-                            boundary_edges.append(edge_id)
-                    
-                    edge_explorer.Next()
-        except Exception as e:
-            print(f"警告: 提取边界边失败: {e}")
-        
-        return boundary_edges
-    
-    def _extract_inner_edges(self, face) -> List[List[int]]:
-        """
-        提取面的内部边（孔）
+        OuterWire 判定和 wire 遍历每个面只执行一次，外边界与孔
+        共享同一轮扫描；此前两者各自调用 OuterWire 并分别遍历
 
         Args:
             face: TopoDS_Face 对象
 
         Returns:
-            list: 内部边ID列表的列表（每个孔一个列表）
+            tuple: (外边界边ID列表, 内部边ID列表的列表（每个孔一个列表）)
         """
+        boundary_edges = []
         inner_edges = []
-        
+        edge_id_get = self._edge_id_get
+        to_wire = topods.Wire
+        to_edge = topods.Edge
+
         try:
-            from OCC.Core.BRepTools import breptools
             outer_wire = breptools.OuterWire(face)
-            
+
             # 遍历所有wire
             wire_explorer = TopExp_Explorer(face, TopAbs_WIRE)
-            
+
             while wire_explorer.More():
-                wire = topods.Wire(wire_explorer.Current())
-                
-                # 跳过外边界
-                if wire.IsSame(outer_wire):
-                    wire_explorer.Next()
-                    continue
-                
-                # 提取内部孔的边
-                hole_edges = []
+                wire = to_wire(wire_explorer.Current())
+
+                # 提取当前wire的边
+                wire_edges = []
                 edge_explorer = TopExp_Explorer(wire, TopAbs_EDGE)
-                
+
                 while edge_explorer.More():
-                    edge = topods.Edge(edge_explorer.Current())
-                    edge_hash = hash(edge.TShape())
-                    
-                    if self.edge_extractor:
-                        edge_id = self.edge_extractor.get_edge_id_by_hash(edge_hash)
-                        if edge_id >= 0:
-                            hole_edges.append(edge_id)
-                    
+                    edge = to_edge(edge_explorer.Current())
+
+                    if edge_id_get is not None:
+                        edge_id = edge_id_get(hash(edge.TShape()))
+                        if edge_id is not None:
+                            wire_edges.append(edge_id)
+
                     edge_explorer.Next()
-                
-                if hole_edges:
-                    inner_edges.append(hole_edges)
-                
+
+                if wire.IsSame(outer_wire):
+                    boundary_edges = wire_edges
+                elif wire_edges:
+                    inner_edges.append(wire_edges)
+
                 wire_explorer.Next()
         except Exception as e:
-            print(f"警告: 提取内部边失败: {e}")
-        
-        return inner_edges
+            print(f"警告: 提取面边界失败: {e}")
+
+        return boundary_edges, inner_edges
     
     def _extract_surface_parameters(
         self,
@@ -310,10 +310,10 @@ class FaceExtractor:
         y_axis = plane.YAxis().Direction()
         
         return {
-            'origin': [origin.X(), origin.Y(), origin.Z()],
-            'normal': [normal.X(), normal.Y(), normal.Z()],
-            'x_axis': [x_axis.X(), x_axis.Y(), x_axis.Z()],
-            'y_axis': [y_axis.X(), y_axis.Y(), y_axis.Z()]
+            'origin': list(origin.Coord()),
+            'normal': list(normal.Coord()),
+            'x_axis': list(x_axis.Coord()),
+            'y_axis': list(y_axis.Coord())
         }
     
     def _extract_cylinder_parameters(self, adaptor: BRepAdaptor_Surface) -> Dict:
@@ -325,8 +325,8 @@ class FaceExtractor:
         radius = cylinder.Radius()
         
         return {
-            'axis_origin': [origin.X(), origin.Y(), origin.Z()],
-            'axis_direction': [axis.X(), axis.Y(), axis.Z()],
+            'axis_origin': list(origin.Coord()),
+            'axis_direction': list(axis.Coord()),
             'radius': radius
         }
     
@@ -340,8 +340,8 @@ class FaceExtractor:
         semi_angle = cone.SemiAngle()
         
         return {
-            'apex': [origin.X(), origin.Y(), origin.Z()],
-            'axis_direction': [axis.X(), axis.Y(), axis.Z()],
+            'apex': list(origin.Coord()),
+            'axis_direction': list(axis.Coord()),
             'ref_radius': radius,
             'semi_angle': semi_angle
         }
@@ -354,7 +354,7 @@ class FaceExtractor:
         radius = sphere.Radius()
         
         return {
-            'center': [center.X(), center.Y(), center.Z()],
+            'center': list(center.Coord()),
             'radius': radius
         }
     
@@ -368,8 +368,8 @@ class FaceExtractor:
         minor_radius = torus.MinorRadius()
         
         return {
-            'center': [center.X(), center.Y(), center.Z()],
-            'axis': [axis.X(), axis.Y(), axis.Z()],
+            'center': list(center.Coord()),
+            'axis': list(axis.Coord()),
             'major_radius': major_radius,
             'minor_radius': minor_radius
         }
@@ -384,40 +384,43 @@ class FaceExtractor:
         v_degree = bspline.VDegree()
         nb_u_poles = bspline.NbUPoles()
         nb_v_poles = bspline.NbVPoles()
-        
-        # 提取控制点网格
-        control_points = []
-        for i in range(1, nb_u_poles + 1):
-            u_row = []
-            for j in range(1, nb_v_poles + 1):
-                pole = bspline.Pole(i, j)
-                u_row.append([pole.X(), pole.Y(), pole.Z()])
-            control_points.append(u_row)
-        
-        # 提取U方向节点
+
+        # 整块取回内部 TColgp_Array2OfPnt，逐项 Value 直接读数组，
+        # 不再经过曲面对象逐索引 Pole(i, j) 的参数检查；
+        # 控制点网格写入预分配的 ndarray，最后一次性 tolist()
+        pole_value = bspline.Poles().Value
+        control_points = np.empty((nb_u_poles, nb_v_poles, 3), dtype=np.float64)
+        for i in range(nb_u_poles):
+            for j in range(nb_v_poles):
+                control_points[i, j] = pole_value(i + 1, j + 1).Coord()
+
+        # U/V 方向节点与重数同样走整块数组 + 预分配缓冲
         nb_u_knots = bspline.NbUKnots()
-        u_knots = []
-        u_multiplicities = []
-        for i in range(1, nb_u_knots + 1):
-            u_knots.append(bspline.UKnot(i))
-            u_multiplicities.append(bspline.UMultiplicity(i))
-        
-        # 提取V方向节点
+        u_knot_value = bspline.UKnots().Value
+        u_mult_value = bspline.UMultiplicities().Value
+        u_knots = np.empty(nb_u_knots, dtype=np.float64)
+        u_multiplicities = np.empty(nb_u_knots, dtype=np.intp)
+        for i in range(nb_u_knots):
+            u_knots[i] = u_knot_value(i + 1)
+            u_multiplicities[i] = u_mult_value(i + 1)
+
         nb_v_knots = bspline.NbVKnots()
-        v_knots = []
-        v_multiplicities = []
-        for i in range(1, nb_v_knots + 1):
-            v_knots.append(bspline.VKnot(i))
-            v_multiplicities.append(bspline.VMultiplicity(i))
-        
+        v_knot_value = bspline.VKnots().Value
+        v_mult_value = bspline.VMultiplicities().Value
+        v_knots = np.empty(nb_v_knots, dtype=np.float64)
+        v_multiplicities = np.empty(nb_v_knots, dtype=np.intp)
+        for i in range(nb_v_knots):
+            v_knots[i] = v_knot_value(i + 1)
+            v_multiplicities[i] = v_mult_value(i + 1)
+
         return {
             'u_degree': u_degree,
             'v_degree': v_degree,
-            'control_points': control_points,
-            'u_knots': u_knots,
-            'u_multiplicities': u_multiplicities,
-            'v_knots': v_knots,
-            'v_multiplicities': v_multiplicities,
+            'control_points': control_points.tolist(),
+            'u_knots': u_knots.tolist(),
+            'u_multiplicities': u_multiplicities.tolist(),
+            'v_knots': v_knots.tolist(),
+            'v_multiplicities': v_multiplicities.tolist(),
             'is_u_periodic': bspline.IsUPeriodic(),
             'is_v_periodic': bspline.IsVPeriodic(),
             'is_u_rational': bspline.IsURational(),
@@ -434,20 +437,18 @@ class FaceExtractor:
         v_degree = bezier.VDegree()
         nb_u_poles = bezier.NbUPoles()
         nb_v_poles = bezier.NbVPoles()
-        
-        # 提取控制点网格
-        control_points = []
-        for i in range(1, nb_u_poles + 1):
-            u_row = []
-            for j in range(1, nb_v_poles + 1):
-                pole = bezier.Pole(i, j)
-                u_row.append([pole.X(), pole.Y(), pole.Z()])
-            control_points.append(u_row)
-        
+
+        # 同 B 样条曲面：整块取回极点网格，先进 ndarray 再一次性转列表
+        pole_value = bezier.Poles().Value
+        control_points = np.empty((nb_u_poles, nb_v_poles, 3), dtype=np.float64)
+        for i in range(nb_u_poles):
+            for j in range(nb_v_poles):
+                control_points[i, j] = pole_value(i + 1, j + 1).Coord()
+
         return {
             'u_degree': u_degree,
             'v_degree': v_degree,
-            'control_points': control_points,
+            'control_points': control_points.tolist(),
             'is_u_rational': bezier.IsURational(),
             'is_v_rational': bezier.IsVRational()
         }
@@ -462,8 +463,8 @@ class FaceExtractor:
         axis_direction = revolution.Direction()
         
         return {
-            'axis_origin': [axis_origin.X(), axis_origin.Y(), axis_origin.Z()],
-            'axis_direction': [axis_direction.X(), axis_direction.Y(), axis_direction.Z()]
+            'axis_origin': list(axis_origin.Coord()),
+            'axis_direction': list(axis_direction.Coord())
         }
     
     def _extract_extrusion_parameters(self, surface) -> Dict:
@@ -475,9 +476,39 @@ class FaceExtractor:
         direction = extrusion.Direction()
         
         return {
-            'direction': [direction.X(), direction.Y(), direction.Z()]
+            'direction': list(direction.Coord())
         }
     
+    def _sample_normal(self, adaptor: BRepAdaptor_Surface, surface) -> Optional[List[float]]:
+        """
+        采样曲面法线
+
+        单个 GeomLProp_SLProps 实例构造一次，采样点通过 SetParameters
+        切换，避免每个 (u, v) 都构造新的 C++ 属性对象
+
+        Args:
+            adaptor: BRepAdaptor_Surface 对象
+            surface: Geom_Surface 对象
+
+        Returns:
+            list or None: 单位法线 [x, y, z]，法线无定义时返回 None
+        """
+        try:
+            props = GeomLProp_SLProps(surface, 1, 1e-6)
+
+            # 参数域中点；退化点（如球面极点）法线无定义时返回 None
+            u = (adaptor.FirstUParameter() + adaptor.LastUParameter()) / 2
+            v = (adaptor.FirstVParameter() + adaptor.LastVParameter()) / 2
+            props.SetParameters(u, v)
+
+            if props.IsNormalDefined():
+                normal = props.Normal()
+                return list(normal.Coord())
+        except Exception as e:
+            print(f"警告: 采样曲面法线失败: {e}")
+
+        return None
+
     def _calculate_face_area(self, face) -> float:
         """
         计算面的面积
@@ -489,13 +520,10 @@ class FaceExtractor:
             float: 面积
         """
         try:
-            from OCC.Core.GProp import GProp_GProps
-            from OCC.Core.BRepGProp import brepgprop
-            
-            props = GProp_GProps()
+            props = _thread_gprops()
             brepgprop.SurfaceProperties(face, props)
             return props.Mass()  # 对于表面属性，Mass()返回面积
-        except:
+        except Exception:
             return 0.0
     
     def _get_face_orientation(self, face) -> str:
@@ -508,8 +536,6 @@ class FaceExtractor:
         Returns:
             str: "forward" 或 "reversed"
         """
-        from OCC.Core.TopAbs import TopAbs_FORWARD, TopAbs_REVERSED
-        
         orientation = face.Orientation()
         
         if orientation == TopAbs_FORWARD:
@@ -0,0 +1,148 @@
+"""
+边长度批量计算内核
+对解析曲线（直线、圆弧、椭圆）按 SoA 数组批量计算长度
+
+设计说明：
+- 边参数在遍历阶段按曲线种类分桶填入 params/radii 数组（AoS→SoA）
+- 每个曲线种类有专用内核（kernel_for 查表分发），桶内循环不含
+  种类分支，LLVM 可以对单一公式做常量折叠和向量化
+- 内核优先用 Numba @njit(parallel=True) 编译，未安装 Numba 时
+  回退到等价的 NumPy 向量化实现
+- 椭圆弧用固定阶 Gauss-Legendre 求积在桶内批量积分，
+  代替 OCCT 对每条边单独做的自适应积分
+- 无解析公式的曲线（B样条、Bezier）返回 -1，由调用方回退到 GProp
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range  # 保持循环实现在纯 Python 下仍可调用
+
+# 曲线种类编码（分桶时使用）
+KIND_LINE = 0
+KIND_CIRCLE = 1
+KIND_ELLIPSE = 2
+KIND_OTHER = -1
+
+# 完整椭圆的参数区间判定容差
+_FULL_TURN_TOL = 1e-6
+
+# 椭圆弧长求积节点/权重（32 点 Gauss-Legendre，
+# 对光滑被积函数远超 float64 精度需求）
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(32)
+
+
+def _line_lengths_loop(params, radii):
+    """直线：gp_Lin 按弧长参数化，参数差即长度"""
+    n = params.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        out[i] = abs(params[i, 1] - params[i, 0])
+    return out
+
+
+def _circle_lengths_loop(params, radii):
+    """圆弧：半径乘参数差"""
+    n = params.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        out[i] = radii[i, 0] * abs(params[i, 1] - params[i, 0])
+    return out
+
+
+def _ellipse_lengths_loop(params, radii):
+    """完整椭圆：Ramanujan 周长近似；椭圆弧：Gauss-Legendre 求积"""
+    n = params.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        t0 = params[i, 0]
+        t1 = params[i, 1]
+        a = radii[i, 0]
+        b = radii[i, 1]
+        if abs(abs(t1 - t0) - 2.0 * math.pi) < _FULL_TURN_TOL:
+            h = ((a - b) / (a + b)) ** 2
+            out[i] = math.pi * (a + b) * (1.0 + 3.0 * h / (10.0 + math.sqrt(4.0 - 3.0 * h)))
+        else:
+            # 弧长 = ∫ sqrt(a²sin²t + b²cos²t) dt，区间映射到 [-1, 1]
+            half = 0.5 * (t1 - t0)
+            mid = 0.5 * (t1 + t0)
+            acc = 0.0
+            for j in range(_GL_NODES.shape[0]):
+                t = mid + half * _GL_NODES[j]
+                sa = a * math.sin(t)
+                cb = b * math.cos(t)
+                acc += _GL_WEIGHTS[j] * math.sqrt(sa * sa + cb * cb)
+            out[i] = abs(half) * acc
+    return out
+
+
+def _line_lengths_numpy(params, radii):
+    """直线长度的 NumPy 向量化回退实现"""
+    return np.abs(params[:, 1] - params[:, 0])
+
+
+def _circle_lengths_numpy(params, radii):
+    """圆弧长度的 NumPy 向量化回退实现"""
+    return radii[:, 0] * np.abs(params[:, 1] - params[:, 0])
+
+
+def _ellipse_lengths_numpy(params, radii):
+    """椭圆周长/弧长的 NumPy 向量化回退实现"""
+    t0 = params[:, 0]
+    t1 = params[:, 1]
+    a = radii[:, 0]
+    b = radii[:, 1]
+    out = np.empty(params.shape[0], dtype=np.float64)
+
+    full = np.abs(np.abs(t1 - t0) - 2.0 * np.pi) < _FULL_TURN_TOL
+    af = a[full]
+    bf = b[full]
+    h = ((af - bf) / (af + bf)) ** 2
+    out[full] = np.pi * (af + bf) * (1.0 + 3.0 * h / (10.0 + np.sqrt(4.0 - 3.0 * h)))
+
+    arc = ~full
+    if arc.any():
+        # (弧数, 节点数) 网格一次性求积
+        half = 0.5 * (t1[arc] - t0[arc])[:, None]
+        mid = 0.5 * (t1[arc] + t0[arc])[:, None]
+        t = mid + half * _GL_NODES
+        integrand = np.sqrt((a[arc][:, None] * np.sin(t)) ** 2
+                            + (b[arc][:, None] * np.cos(t)) ** 2)
+        out[arc] = np.abs(half[:, 0]) * (integrand @ _GL_WEIGHTS)
+
+    return out
+
+
+if HAS_NUMBA:
+    line_lengths = njit(parallel=True, cache=True)(_line_lengths_loop)
+    circle_lengths = njit(parallel=True, cache=True)(_circle_lengths_loop)
+    ellipse_lengths = njit(parallel=True, cache=True)(_ellipse_lengths_loop)
+else:
+    line_lengths = _line_lengths_numpy
+    circle_lengths = _circle_lengths_numpy
+    ellipse_lengths = _ellipse_lengths_numpy
+
+# 种类 -> 专用内核（统一签名 (params, radii)，直线忽略 radii）
+_KERNELS = {
+    KIND_LINE: line_lengths,
+    KIND_CIRCLE: circle_lengths,
+    KIND_ELLIPSE: ellipse_lengths,
+}
+
+
+def kernel_for(kind):
+    """
+    获取指定曲线种类的专用长度内核
+
+    Args:
+        kind: 曲线种类编码（KIND_*）
+
+    Returns:
+        callable or None: 内核函数，无解析内核的种类返回 None
+    """
+    return _KERNELS.get(kind)
@@ -3,11 +3,35 @@
 从 TopoDS_Shape 提取所有顶点信息
 """
 
-from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopAbs import TopAbs_VERTEX
 from OCC.Core.TopoDS import topods
 from OCC.Core.BRep import BRep_Tool
 from typing import List, Dict, Tuple
+import numpy as np
+
+from ..topology.entity_cache import topods_entities
+
+
+def vertices_to_array(shape) -> np.ndarray:
+    """
+    将形状的所有顶点坐标提取为连续的 NumPy 数组
+
+    相比逐顶点构建 Python 列表，预分配 (N, 3) float64 数组并直接写入，
+    下游的 NumPy 运算（包围盒、长度、切向点积等）可以在连续内存上进行
+
+    Args:
+        shape: TopoDS_Shape 对象
+
+    Returns:
+        np.ndarray: (N, 3) float64 坐标数组（按枚举顺序）
+    """
+    verts = topods_entities(shape, TopAbs_VERTEX)
+    arr = np.empty((len(verts), 3), dtype=np.float64)
+
+    for i, sub_shape in enumerate(verts):
+        arr[i] = BRep_Tool.Pnt(topods.Vertex(sub_shape)).Coord()
+
+    return arr
 
 
 class VertexExtractor:
@@ -37,35 +61,46 @@ class VertexExtractor:
                 vertices_data: 顶点数据列表
                 vertices_map: 哈希到顶点对象的映射
         """
-        explorer = TopExp_Explorer(self.shape, TopAbs_VERTEX)
+        verts = topods_entities(self.shape, TopAbs_VERTEX)
+
+        # 预分配坐标缓冲并直接步长写入，
+        # 避免逐顶点构建 (x, y, z) 小列表带来的分配和引用计数开销
+        coords = np.empty((len(verts), 3), dtype=np.float64)
+        vertex_objects = []
+
+        for i, sub_shape in enumerate(verts):
+            vertex = topods.Vertex(sub_shape)
+            coords[i] = BRep_Tool.Pnt(vertex).Coord()
+            vertex_objects.append(vertex)
+
+        # 序列化前量化到 6 位小数（约 float32 精度，前端 WebGL
+        # 渲染本来就是 float32）：0.30000000000000004 这类 float64
+        # 长尾会被截断，JSON 文本体积显著下降，几何上无可见差异
+        np.round(coords, 6, out=coords)
+
+        # 一次性在 C 层转换为嵌套列表（代替 N 次 Python 小列表构建）
+        positions = coords.tolist()
+
         vertex_id = 0
-        
-        while explorer.More():
-            vertex = topods.Vertex(explorer.Current())
-            
-            # 获取顶点坐标
-            point = BRep_Tool.Pnt(vertex)
-            
+        for i, vertex in enumerate(vertex_objects):
             # 获取 OCC HashCode（永久标识符）
             # 使用 Python 内置 hash() 对 TShape 对象求哈希
             vertex_hash = hash(vertex.TShape())
-            
+
             # 检查是否已经处理过这个顶点（去重）
             if vertex_hash not in self.vertex_id_map:
                 vertex_data = {
                     'id': vertex_id,
                     'hash': vertex_hash,
-                    'position': [point.X(), point.Y(), point.Z()]
+                    'position': positions[i]
                 }
-                
+
                 self.vertices_data.append(vertex_data)
                 self.vertices_map[vertex_hash] = vertex
                 self.vertex_id_map[vertex_hash] = vertex_id
-                
+
                 vertex_id += 1
-            
-            explorer.Next()
-        
+
         print(f"✓ 提取顶点: {len(self.vertices_data)} 个")
         return self.vertices_data, self.vertices_map
     
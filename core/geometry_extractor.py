@@ -7,7 +7,13 @@
 from .extractors import VertexExtractor, EdgeExtractor, FaceExtractor
 from .topology import AdjacencyBuilder
 from .serializers import GeometrySerializer
-from typing import Dict, Tuple
+from typing import Dict
+import sys
+
+# 固定的进度横幅在模块加载时拼接一次，
+# 每次提取只需一个 stdout 写调用，而不是逐行 print
+_BANNER_START = "=" * 60 + "\n开始提取几何和拓扑信息...\n" + "=" * 60 + "\n"
+_BANNER_DONE = "\n" + "=" * 60 + "\n提取完成！\n" + "=" * 60 + "\n"
 
 
 class GeometryExtractor:
@@ -63,10 +69,8 @@ class GeometryExtractor:
         Returns:
             dict: 完整的几何数据（符合 geometry_data_schema.md）
         """
-        print("=" * 60)
-        print("开始提取几何和拓扑信息...")
-        print("=" * 60)
-        
+        sys.stdout.write(_BANNER_START)
+
         # 步骤1: 提取顶点
         print("\n[1/5] 提取顶点...")
         self.vertex_extractor = VertexExtractor(self.shape)
@@ -104,10 +108,8 @@ class GeometryExtractor:
         )
         result = serializer.serialize()
         
-        print("\n" + "=" * 60)
-        print("提取完成！")
-        print("=" * 60)
-        
+        sys.stdout.write(_BANNER_DONE)
+
         return result
     
     def get_vertices_map(self) -> Dict:
@@ -171,16 +173,15 @@ class GeometryExtractor:
             dict: 拓扑摘要
         """
         edge_face_map = self.topology.get('edge_face_map', {})
-        potential_weld_edges = [
-            edge_id for edge_id, faces in edge_face_map.items() 
-            if len(faces) == 2
-        ]
-        
+        num_potential_weld_edges = sum(
+            1 for faces in edge_face_map.values() if len(faces) == 2
+        )
+
         return {
             'num_vertices': len(self.vertices_data),
             'num_edges': len(self.edges_data),
             'num_faces': len(self.faces_data),
-            'num_potential_weld_edges': len(potential_weld_edges),
+            'num_potential_weld_edges': num_potential_weld_edges,
             'has_topology': bool(self.topology)
         }
 
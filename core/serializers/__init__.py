@@ -3,10 +3,12 @@
 将 OCC 几何对象序列化为 JSON 格式
 """
 
-from .geometry_serializer import GeometrySerializer
+from .geometry_serializer import GeometrySerializer, bounding_box, bounding_box_optimal
 
 __all__ = [
     'GeometrySerializer',
+    'bounding_box',
+    'bounding_box_optimal',
 ]
 
 
@@ -6,8 +6,137 @@
 
 from OCC.Core.Bnd import Bnd_Box
 from OCC.Core.BRepBndLib import brepbndlib
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 import datetime
+import math
+
+import numpy as np
+
+from ..extractors.length_kernels import HAS_NUMBA
+from ..topology.entity_cache import register_shape, shape_for_key
+
+if HAS_NUMBA:
+    from numba import njit
+
+
+def _stats_loop(values):
+    """单遍扫描求 min/max/sum/平方和（供 Numba 编译）"""
+    vmin = values[0]
+    vmax = values[0]
+    total = 0.0
+    total_sq = 0.0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v < vmin:
+            vmin = v
+        if v > vmax:
+            vmax = v
+        total += v
+        total_sq += v * v
+    return vmin, vmax, total, total_sq
+
+
+def _angles_loop(n1, n2):
+    """逐行点积→clip→acos→角度，单循环融合（供 Numba 编译）
+
+    等价于 NumPy 的 einsum/clip/arccos/degrees 四次数组遍历，
+    编译后一遍扫描完成，无中间数组
+    """
+    n = n1.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        d = (n1[i, 0] * n2[i, 0] + n1[i, 1] * n2[i, 1]
+             + n1[i, 2] * n2[i, 2])
+        if d > 1.0:
+            d = 1.0
+        elif d < -1.0:
+            d = -1.0
+        out[i] = math.degrees(math.acos(d))
+    return out
+
+
+if HAS_NUMBA:
+    _stats_kernel = njit(cache=True, fastmath=True)(_stats_loop)
+    _angles_kernel = njit(cache=True, fastmath=True)(_angles_loop)
+else:
+    _stats_kernel = None
+    _angles_kernel = None
+
+
+def _value_stats(values) -> Dict:
+    """
+    计算一组数值的统计量（min/max/mean/std）
+
+    有 Numba 时单遍 JIT 扫描（一次过数组同时累出四个量），
+    否则用 NumPy 的 C 级归约
+
+    Args:
+        values: 数值列表或一维 ndarray
+
+    Returns:
+        dict: {min, max, mean, std}；空输入返回全 0
+    """
+    arr = np.asarray(values, dtype=np.float64)
+
+    if arr.size == 0:
+        return {'min': 0.0, 'max': 0.0, 'mean': 0.0, 'std': 0.0}
+
+    if _stats_kernel is not None:
+        vmin, vmax, total, total_sq = _stats_kernel(arr)
+        n = arr.shape[0]
+        mean = total / n
+        variance = max(total_sq / n - mean * mean, 0.0)
+        return {'min': float(vmin), 'max': float(vmax),
+                'mean': float(mean), 'std': float(variance ** 0.5)}
+
+    return {'min': float(arr.min()), 'max': float(arr.max()),
+            'mean': float(arr.mean()), 'std': float(arr.std())}
+
+
+@lru_cache(maxsize=64)
+def _bounding_box_values(shape_key: int) -> Tuple[float, ...]:
+    """按形状缓存键计算包围盒（内部缓存实现）"""
+    bbox = Bnd_Box()
+    brepbndlib.Add(shape_for_key(shape_key), bbox)
+    return bbox.Get()
+
+
+@lru_cache(maxsize=64)
+def _bounding_box_optimal_values(shape_key: int) -> Tuple[float, ...]:
+    """按形状缓存键计算紧致包围盒（内部缓存实现）"""
+    bbox = Bnd_Box()
+    brepbndlib.AddOptimal(shape_for_key(shape_key), bbox)
+    return bbox.Get()
+
+
+def bounding_box(shape) -> Tuple[float, ...]:
+    """
+    计算形状的包围盒（带缓存）
+
+    Args:
+        shape: TopoDS_Shape 对象
+
+    Returns:
+        tuple: (xmin, ymin, zmin, xmax, ymax, zmax)
+    """
+    return _bounding_box_values(register_shape(shape))
+
+
+def bounding_box_optimal(shape) -> Tuple[float, ...]:
+    """
+    计算形状的紧致包围盒（带缓存）
+
+    注意：AddOptimal 比 Add 明显更慢，只在确实需要
+    紧致包围盒时使用（普通 Add 对曲面会偏保守）
+
+    Args:
+        shape: TopoDS_Shape 对象
+
+    Returns:
+        tuple: (xmin, ymin, zmin, xmax, ymax, zmax)
+    """
+    return _bounding_box_optimal_values(register_shape(shape))
 
 
 class GeometrySerializer:
@@ -110,11 +239,9 @@ class GeometrySerializer:
             dict: 包围盒 {min: [x, y, z], max: [x, y, z]}
         """
         try:
-            bbox = Bnd_Box()
-            brepbndlib.Add(self.shape, bbox)
-            
-            xmin, ymin, zmin, xmax, ymax, zmax = bbox.Get()
-            
+            # 包围盒按形状缓存，重复序列化同一形状时直接复用
+            xmin, ymin, zmin, xmax, ymax, zmax = bounding_box(self.shape)
+
             return {
                 'min': [xmin, ymin, zmin],
                 'max': [xmax, ymax, zmax],
@@ -179,12 +306,29 @@ class GeometrySerializer:
         """
         # 提取潜在的焊缝边
         potential_weld_seams = self._extract_potential_weld_seams()
-        
+
         if potential_weld_seams:
+            # np.fromiter 直接从生成器填充双精度数组：
+            # 不先装箱成 Python float 列表再转数组
+            count = len(potential_weld_seams)
+            lengths = np.fromiter(
+                (s['properties']['length'] or 0.0
+                 for s in potential_weld_seams),
+                dtype=np.float64, count=count)
+            angles = np.fromiter(
+                (s['properties']['angle']
+                 for s in potential_weld_seams),
+                dtype=np.float64, count=count)
+
             return {
-                'potential_weld_seams': potential_weld_seams
+                'potential_weld_seams': potential_weld_seams,
+                'seam_statistics': {
+                    'count': count,
+                    'length': _value_stats(lengths),
+                    'angle': _value_stats(angles)
+                }
             }
-        
+
         return {}
     
     def _extract_potential_weld_seams(self) -> List[Dict]:
@@ -196,87 +340,110 @@ class GeometrySerializer:
         """
         potential_seams = []
         edge_face_map = self.topology.get('edge_face_map', {})
-        
-        # 遍历所有连接恰好两个面的边
+
+        # 预建 id -> 数据 的索引：避免对每条候选边线性扫描
+        # edges_data / faces_data（边数 × 面数的 O(N²) 查找）
+        edges_by_id = {e['id']: e for e in self.edges_data}
+        faces_by_id = {f['id']: f for f in self.faces_data}
+
+        # 第一遍：收集候选边及其两侧面数据
+        candidates = []
         for edge_id, face_ids in edge_face_map.items():
             if len(face_ids) == 2:
                 # 找到边数据
-                edge_data = next((e for e in self.edges_data if e['id'] == edge_id), None)
+                edge_data = edges_by_id.get(edge_id)
                 if not edge_data:
                     continue
-                
+
                 # 找到两个面的数据
-                face1 = next((f for f in self.faces_data if f['id'] == face_ids[0]), None)
-                face2 = next((f for f in self.faces_data if f['id'] == face_ids[1]), None)
-                
+                face1 = faces_by_id.get(face_ids[0])
+                face2 = faces_by_id.get(face_ids[1])
+
                 if not face1 or not face2:
                     continue
-                
-                # 计算两个面之间的角度（简化版）
-                angle = self._calculate_face_angle(face1, face2)
-                
-                # 判断焊缝类型
-                weld_type = self._classify_weld_type(angle)
-                
-                # 计算置信度（简化版）
-                confidence = 0.8 if weld_type != "unknown" else 0.3
-                
-                seam_info = {
-                    'edge_id': edge_id,
-                    'edge_hash': edge_data['hash'],
-                    'type': weld_type,
-                    'confidence': confidence,
-                    'properties': {
-                        'gap': 0.0,  # 需要更精确的计算
-                        'angle': angle,
-                        'length': edge_data.get('length', 0.0),
-                        'face1_id': face_ids[0],
-                        'face2_id': face_ids[1],
-                        'face1_type': face1['type'],
-                        'face2_type': face2['type']
-                    },
-                    'adjacent_faces': face_ids
-                }
-                
-                potential_seams.append(seam_info)
-        
+
+                candidates.append((edge_id, face_ids, edge_data, face1, face2))
+
+        if not candidates:
+            return potential_seams
+
+        # 批量计算所有候选边的面夹角（一次向量化调用）
+        angles = self._batch_face_angles(
+            [(c[3], c[4]) for c in candidates])
+
+        for (edge_id, face_ids, edge_data, face1, face2), angle in \
+                zip(candidates, angles):
+            # 判断焊缝类型
+            weld_type = self._classify_weld_type(angle)
+
+            # 计算置信度（简化版）
+            confidence = 0.8 if weld_type != "unknown" else 0.3
+
+            seam_info = {
+                'edge_id': edge_id,
+                'edge_hash': edge_data['hash'],
+                'type': weld_type,
+                'confidence': confidence,
+                'properties': {
+                    'gap': 0.0,  # 需要更精确的计算
+                    'angle': angle,
+                    'length': edge_data.get('length', 0.0),
+                    'face1_id': face_ids[0],
+                    'face2_id': face_ids[1],
+                    'face1_type': face1['type'],
+                    'face2_type': face2['type']
+                },
+                'adjacent_faces': face_ids
+            }
+
+            potential_seams.append(seam_info)
+
         return potential_seams
-    
-    def _calculate_face_angle(self, face1: Dict, face2: Dict) -> float:
+
+    def _batch_face_angles(self, face_pairs: List[Tuple[Dict, Dict]]) -> List[float]:
         """
-        计算两个面之间的角度（简化版）
+        批量计算面对之间的角度（简化版：仅处理平面-平面）
+
+        把所有平面-平面对的法向打包成 (N, 3) 数组，
+        点积 / clip / arccos 各做一次向量化调用，
+        代替每条候选边一次 Python 级点积和 math.acos。
 
         Args:
-            face1: 面1数据
-            face2: 面2数据
+            face_pairs: (面1数据, 面2数据) 列表
 
         Returns:
-            float: 角度（度）
+            list: 角度列表（度），非平面对返回默认 90.0
         """
-        import math
-        
-        # 简化版：仅处理平面
-        if face1['type'] == 'plane' and face2['type'] == 'plane':
-            try:
-                normal1 = face1['surface_data'].get('normal', [0, 0, 1])
-                normal2 = face2['surface_data'].get('normal', [0, 0, 1])
-                
-                # 计算点积
-                dot_product = sum(n1 * n2 for n1, n2 in zip(normal1, normal2))
-                
-                # 限制在 [-1, 1] 范围内
-                dot_product = max(-1.0, min(1.0, dot_product))
-                
-                # 计算角度
-                angle_rad = math.acos(dot_product)
-                angle_deg = math.degrees(angle_rad)
-                
-                return angle_deg
-            except:
-                pass
-        
-        # 默认返回未知角度
-        return 90.0
+        angles = [90.0] * len(face_pairs)
+
+        plane_indices = []
+        normals1 = []
+        normals2 = []
+        for i, (face1, face2) in enumerate(face_pairs):
+            if face1['type'] == 'plane' and face2['type'] == 'plane':
+                plane_indices.append(i)
+                normals1.append(
+                    face1['surface_data'].get('normal', [0, 0, 1]))
+                normals2.append(
+                    face2['surface_data'].get('normal', [0, 0, 1]))
+
+        if plane_indices:
+            n1 = np.asarray(normals1, dtype=np.float64)
+            n2 = np.asarray(normals2, dtype=np.float64)
+
+            # 有 Numba 时用融合内核单遍算完；否则逐行点积，
+            # 限制在 [-1, 1] 后一次性求角度。
+            # tolist() 批量转 Python float，避免逐元素的 NumPy 标量调度
+            if _angles_kernel is not None:
+                plane_angles = _angles_kernel(n1, n2).tolist()
+            else:
+                dots = np.clip(np.einsum('ij,ij->i', n1, n2), -1.0, 1.0)
+                plane_angles = np.degrees(np.arccos(dots)).tolist()
+
+            for i, angle in zip(plane_indices, plane_angles):
+                angles[i] = angle
+
+        return angles
     
     def _classify_weld_type(self, angle: float) -> str:
         """
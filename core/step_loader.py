@@ -43,6 +43,45 @@ class StepLoader:
         else:
             raise Exception(f"加载STEP文件失败: {filepath}")
 
+    def load_stream(self, stream, name="upload.step"):
+        """
+        从内存流加载STEP数据（小文件跳过磁盘往返）
+
+        优先使用 STEPControl_Reader.ReadStream（较新的 OCCT 提供），
+        不可用时回退到临时文件路径
+
+        Args:
+            stream: 可读的二进制流（如 io.BytesIO）
+            name: 流名称（用于日志和错误信息）
+
+        Returns:
+            shape: TopoDS_Shape对象
+        """
+        self.reader = STEPControl_Reader()
+
+        if not hasattr(self.reader, 'ReadStream'):
+            # 旧版本绑定没有 ReadStream：写入临时文件再走文件路径
+            import tempfile
+            with tempfile.NamedTemporaryFile(suffix='.step', delete=False) as tmp:
+                tmp.write(stream.read())
+                filepath = tmp.name
+            try:
+                return self.load_file(filepath)
+            finally:
+                os.remove(filepath)
+
+        status = self.reader.ReadStream(name, stream)
+
+        if status == IFSelect_RetDone:
+            # 传输所有根
+            self.reader.TransferRoots()
+            # 获取形状
+            self.shape = self.reader.OneShape()
+            print(f"成功加载STEP流: {name}")
+            return self.shape
+        else:
+            raise Exception(f"加载STEP流失败: {name}")
+
     def get_shape(self):
         """获取已加载的形状"""
         return self.shape
@@ -4,9 +4,17 @@
 """
 
 from .adjacency_builder import AdjacencyBuilder
+from .entity_cache import topods_entities, entity_cache_info, clear_entity_cache
+from .topology_maps import TopologyMaps, topology_maps, clear_topology_maps
 
 __all__ = [
     'AdjacencyBuilder',
+    'topods_entities',
+    'entity_cache_info',
+    'clear_entity_cache',
+    'TopologyMaps',
+    'topology_maps',
+    'clear_topology_maps',
 ]
 
 
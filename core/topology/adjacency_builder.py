@@ -8,14 +8,13 @@
 3. vertex_edge_map: 用于分析顶点周围的边
 """
 
-from OCC.Core.TopExp import TopExp_Explorer
-from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_EDGE
 from OCC.Core.TopoDS import topods
-from OCC.Core.TopTools import TopTools_IndexedDataMapOfShapeListOfShape, TopTools_ListIteratorOfListOfShape
-from OCC.Core.TopExp import topexp
-from typing import Dict, List, Set
+from OCC.Core.TopTools import TopTools_ListIteratorOfListOfShape
+from typing import Dict, List
 from collections import defaultdict
 
+from .topology_maps import topology_maps
+
 
 class AdjacencyBuilder:
     """拓扑邻接关系构建器"""
@@ -37,7 +36,11 @@ class AdjacencyBuilder:
         self.faces_data = faces_data
         self.edges_data = edges_data
         self.vertices_data = vertices_data
-        
+
+        # 构造时就拿到按形状缓存的祖先映射：
+        # 查询方法不再各自触发 topology_maps 查找
+        self._maps = topology_maps(shape)
+
         # 构建哈希到ID的映射
         self.face_hash_to_id = {face['hash']: face['id'] for face in faces_data}
         self.edge_hash_to_id = {edge['hash']: edge['id'] for edge in edges_data}
@@ -84,39 +87,35 @@ class AdjacencyBuilder:
         
         对于每条边，找出所有包含它的面
         """
-        # 使用 OCC 的 TopExp 工具构建映射
-        edge_face_map_occ = TopTools_IndexedDataMapOfShapeListOfShape()
-        topexp.MapShapesAndAncestors(
-            self.shape,
-            TopAbs_EDGE,
-            TopAbs_FACE,
-            edge_face_map_occ
-        )
-        
+        # 使用按形状缓存的祖先映射（同一形状只遍历一次）
+        edge_face_map_occ = self._maps.edge_face
+
+        # 绑定 .get：转换循环里每条边/面只做一次哈希查找，
+        # 替代 `in` 判断 + 下标取值的两轮查找
+        get_edge_id = self.edge_hash_to_id.get
+        get_face_id = self.face_hash_to_id.get
+
         # 转换为我们的数据结构
         for i in range(1, edge_face_map_occ.Size() + 1):
             edge = edge_face_map_occ.FindKey(i)
-            edge_hash = hash(edge.TShape())
-            
-            if edge_hash in self.edge_hash_to_id:
-                edge_id = self.edge_hash_to_id[edge_hash]
-                
+            edge_id = get_edge_id(hash(edge.TShape()))
+
+            if edge_id is not None:
                 # 获取相邻的面
                 face_list = edge_face_map_occ.FindFromIndex(i)
                 adjacent_face_ids = []
-                
+
                 # 使用迭代器遍历列表
                 face_iter = TopTools_ListIteratorOfListOfShape(face_list)
                 while face_iter.More():
                     face = topods.Face(face_iter.Value())
-                    face_hash = hash(face.TShape())
-                    
-                    if face_hash in self.face_hash_to_id:
-                        face_id = self.face_hash_to_id[face_hash]
+                    face_id = get_face_id(hash(face.TShape()))
+
+                    if face_id is not None:
                         adjacent_face_ids.append(face_id)
-                    
+
                     face_iter.Next()
-                
+
                 if adjacent_face_ids:
                     self.edge_face_map[edge_id] = adjacent_face_ids
     
@@ -254,11 +253,22 @@ class AdjacencyBuilder:
         Returns:
             dict: 拓扑摘要信息
         """
+        # 单次遍历统计：is_boundary_edge/is_internal_edge 每次都重查
+        # 相邻面列表，逐边调用会对同一映射做四轮查询
         total_edges = len(self.edge_face_map)
-        boundary_edges = sum(1 for edge_id in self.edge_face_map if self.is_boundary_edge(edge_id))
-        internal_edges = sum(1 for edge_id in self.edge_face_map if self.is_internal_edge(edge_id))
-        potential_weld_edges = len(self.get_potential_weld_edges())
-        
+        boundary_edges = 0
+        internal_edges = 0
+        potential_weld_edges = 0
+
+        for face_ids in self.edge_face_map.values():
+            n = len(face_ids)
+            if n == 1:
+                boundary_edges += 1
+            elif n >= 2:
+                internal_edges += 1
+                if n == 2:
+                    potential_weld_edges += 1
+
         return {
             'total_edges': total_edges,
             'boundary_edges': boundary_edges,
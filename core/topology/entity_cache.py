@@ -0,0 +1,125 @@
+"""
+拓扑实体枚举缓存
+避免对同一个 TopoDS_Shape 重复构造 TopExp_Explorer 遍历
+
+关键用途：
+1. 特征识别过程中会对同一形状反复枚举顶点/边/面
+2. 缓存后重复枚举退化为一次字典查找（O(1)）
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+
+from OCC.Core.TopExp import topexp
+from OCC.Core.TopTools import TopTools_IndexedMapOfShape
+
+# 形状注册表：lru_cache 的键必须可哈希且稳定，
+# 因此用 TShape 哈希作为键，并在注册表中保留原始形状引用。
+# 按 LRU 限容：注册表持有完整 B-Rep 的强引用，不淘汰的话
+# 每次上传都会把整个模型永久钉在内存里；被淘汰的键只在
+# 各 lru_cache 未命中时才会被 shape_for_key 查询，而未命中
+# 路径总是先经过 register_shape 重新注册
+_REGISTRY_SIZE = 16
+_shape_registry = OrderedDict()
+
+# 单槽记忆：提取管线会拿同一个形状包装对象连续调用
+# register_shape（枚举顶点/边/面、拓扑映射、包围盒各一次），
+# 按对象同一性直接返回上次算好的键，省去重复的 TShape 哈希
+_last_registered = (None, 0)
+
+
+def register_shape(shape) -> int:
+    """
+    注册形状并返回其缓存键
+
+    Args:
+        shape: TopoDS_Shape 对象
+
+    Returns:
+        int: TShape 哈希值（缓存键）
+    """
+    global _last_registered
+    last_shape, last_key = _last_registered
+    if last_shape is shape:
+        return last_key
+
+    key = hash(shape.TShape())
+    if key in _shape_registry:
+        _shape_registry.move_to_end(key)
+    else:
+        _shape_registry[key] = shape
+        if len(_shape_registry) > _REGISTRY_SIZE:
+            _shape_registry.popitem(last=False)
+    _last_registered = (shape, key)
+    return key
+
+
+def shape_for_key(shape_key: int):
+    """
+    根据缓存键取回已注册的形状
+
+    Args:
+        shape_key: register_shape 返回的缓存键
+
+    Returns:
+        TopoDS_Shape: 形状对象
+    """
+    return _shape_registry[shape_key]
+
+
+@lru_cache(maxsize=256)
+def _topods_entities(shape_key: int, topo_type) -> tuple:
+    """
+    枚举指定类型的子形状（内部缓存实现）
+
+    实现说明：用 topexp.MapShapes 一次 C++ 遍历填充 IndexedMap，
+    避免 TopExp_Explorer 的逐元素 Python↔C++ 调用开销
+
+    Args:
+        shape_key: 形状缓存键（TShape 哈希）
+        topo_type: TopAbs_* 拓扑类型
+
+    Returns:
+        tuple: 子形状元组（按 IndexedMap 索引顺序，已去重）
+    """
+    shape = shape_for_key(shape_key)
+    shape_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, topo_type, shape_map)
+
+    find_key = shape_map.FindKey
+    return tuple(find_key(i) for i in range(1, shape_map.Extent() + 1))
+
+
+def topods_entities(shape, topo_type) -> tuple:
+    """
+    枚举形状下指定类型的所有子形状（带缓存）
+
+    注意：IndexedMap 已对子形状去重，结果按首次出现顺序排列，
+    与 TopExp_Explorer 去重后的遍历顺序一致
+
+    Args:
+        shape: TopoDS_Shape 对象
+        topo_type: TopAbs_* 拓扑类型
+
+    Returns:
+        tuple: 子形状元组
+    """
+    return _topods_entities(register_shape(shape), topo_type)
+
+
+def entity_cache_info():
+    """
+    获取缓存统计信息（命中/未命中/当前大小）
+
+    Returns:
+        CacheInfo: lru_cache 统计信息
+    """
+    return _topods_entities.cache_info()
+
+
+def clear_entity_cache():
+    """清空实体枚举缓存和形状注册表"""
+    global _last_registered
+    _topods_entities.cache_clear()
+    _shape_registry.clear()
+    _last_registered = (None, 0)
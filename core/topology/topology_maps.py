@@ -0,0 +1,90 @@
+"""
+拓扑祖先映射缓存
+按需构建并缓存 边→面 / 顶点→边 / 边→体 的祖先映射
+
+关键用途：
+1. 邻接关系构建和特征识别都需要 MapShapesAndAncestors 的结果，
+   每次调用都会遍历整个形状，按形状缓存后只遍历一次
+2. 焊缝识别重复查询同一形状的边-面关系时直接复用
+
+每张映射都是整形状的一次 C++ 遍历，因此按属性惰性构建：
+只取 edge_face 的调用方（目前的主流程）不用为
+vertex_edge / edge_solid 各付一趟遍历
+"""
+
+from functools import lru_cache
+
+from OCC.Core.TopAbs import TopAbs_VERTEX, TopAbs_EDGE, TopAbs_FACE, TopAbs_SOLID
+from OCC.Core.TopExp import topexp
+from OCC.Core.TopTools import TopTools_IndexedDataMapOfShapeListOfShape
+
+from .entity_cache import register_shape, shape_for_key
+
+
+class TopologyMaps:
+    """单个形状的拓扑祖先映射集合（属性首次访问时构建）"""
+
+    __slots__ = ('_shape', '_edge_face', '_vertex_edge', '_edge_solid')
+
+    def __init__(self, shape):
+        """
+        初始化映射集合（不触发任何遍历）
+
+        Args:
+            shape: TopoDS_Shape 对象
+        """
+        self._shape = shape
+        self._edge_face = None
+        self._vertex_edge = None
+        self._edge_solid = None
+
+    def _build(self, sub_type, ancestor_type):
+        """构建一张祖先映射（一次 C++ 遍历）"""
+        ancestors = TopTools_IndexedDataMapOfShapeListOfShape()
+        topexp.MapShapesAndAncestors(self._shape, sub_type, ancestor_type, ancestors)
+        return ancestors
+
+    @property
+    def edge_face(self):
+        """边→面祖先映射（焊缝识别的核心查询）"""
+        if self._edge_face is None:
+            self._edge_face = self._build(TopAbs_EDGE, TopAbs_FACE)
+        return self._edge_face
+
+    @property
+    def vertex_edge(self):
+        """顶点→边祖先映射"""
+        if self._vertex_edge is None:
+            self._vertex_edge = self._build(TopAbs_VERTEX, TopAbs_EDGE)
+        return self._vertex_edge
+
+    @property
+    def edge_solid(self):
+        """边→体祖先映射"""
+        if self._edge_solid is None:
+            self._edge_solid = self._build(TopAbs_EDGE, TopAbs_SOLID)
+        return self._edge_solid
+
+
+@lru_cache(maxsize=16)
+def _topology_maps(shape_key: int) -> TopologyMaps:
+    """按形状缓存键构建拓扑映射（内部缓存实现）"""
+    return TopologyMaps(shape_for_key(shape_key))
+
+
+def topology_maps(shape) -> TopologyMaps:
+    """
+    获取形状的拓扑祖先映射（带缓存）
+
+    Args:
+        shape: TopoDS_Shape 对象
+
+    Returns:
+        TopologyMaps: 祖先映射集合
+    """
+    return _topology_maps(register_shape(shape))
+
+
+def clear_topology_maps():
+    """清空拓扑映射缓存"""
+    _topology_maps.cache_clear()
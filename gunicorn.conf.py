@@ -0,0 +1,31 @@
+"""
+gunicorn 配置（生产环境）
+
+启动方式（自动读取本文件）:
+
+    gunicorn wsgi:app
+
+worker 模型说明：
+- 会话状态（当前加载的模型）和结果/网格缓存都保存在进程内，
+  多个 worker 从同一个监听 socket 抢请求时，上传落在一个进程、
+  后续的 /api/model/info、/api/mesh、/api/export 落在另一个进程，
+  直接 404，因此默认单进程；
+- 并发靠 gthread 线程池：OCCT 的 C++ 计算释放 GIL，
+  线程可以并发执行几何提取、三角化和 I/O；
+- 确需多进程横向扩展时，按 docs/nginx.md 的做法为每个端口
+  起一个单 worker 实例，由 nginx `ip_hash` 在端口间做会话粘性
+  （对着单个 bind 开多 worker 时 nginx 无法在进程间做粘性）。
+"""
+import os
+
+workers = 1
+threads = max(8, os.cpu_count() or 8)
+worker_class = 'gthread'
+
+# 大模型的加载和特征提取可能跑几分钟，放宽超时避免 worker 被误杀
+timeout = 300
+
+# 不做 max_requests 定期回收：回收会丢掉进程内的模型会话和
+# 全部缓存，而前端以 1~5Hz 轮询 /model/info，很快就会触发
+
+bind = '0.0.0.0:5000'
@@ -0,0 +1,22 @@
+"""
+WSGI 入口（生产环境）
+
+Flask 自带的开发服务器是单线程同步的，一个大文件上传会阻塞所有请求。
+生产环境用 gunicorn 运行（worker 参数见仓库根目录的 gunicorn.conf.py）：
+
+    gunicorn wsgi:app
+
+OCCT 的几何计算在 C++ 中执行且释放 GIL，配合多线程 worker
+可以让上传处理随 CPU 核数线性扩展。
+"""
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from api import create_app
+from api.config import ProductionConfig
+
+app = create_app(ProductionConfig)